@@ -0,0 +1,230 @@
+"""Local fast-path router.
+
+Decides, without an LLM round trip, which tool an incoming question needs.
+Hand-written rules cover the common question shapes; a small multinomial
+naive Bayes classifier trained on ``SEED_EXAMPLES`` catches paraphrases the
+rules miss. When neither is confident the router abstains and the LLM picks
+the tool as before.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+RETRIEVER = "retriever_tool"
+FINANCIALS = "polygon_financials"
+WEB_SEARCH = "tavily_search_results_json"
+INDICATORS = "technical_indicators_tool"
+BACKTEST = "backtest_tool"
+
+# Upper-case words that look like tickers but are not
+NOT_TICKERS = {
+    "A", "I", "AI", "AND", "API", "ARE", "CEO", "CFO", "DCF", "EMA", "EPS", "ETF", "FOR", "GDP",
+    "HOW", "IPO", "IS", "MACD", "NAV", "NYSE", "OF", "OR", "PE", "Q1", "Q2", "Q3", "Q4", "RSI",
+    "SEC", "SMA", "THE", "TTM", "US", "USA", "USD", "VS", "WHAT", "YOY", "YTD",
+}
+# "$F" or a bare run of 2-5 capitals; letters joined by & or / ("S&P", "P/E") are not tickers
+TICKER_PATTERN = re.compile(r"(?:\$([A-Z]{1,5})|(?<![\w&/$])([A-Z]{2,5}))\b(?![&/])")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+FINANCIAL_TERMS = re.compile(
+    r"\b(revenue|revenues|sales|earnings|net income|income statement|profit|profits|margin|"
+    r"balance sheet|cash flow|financials|eps|liabilities|assets|operating income|debt|"
+    r"p/e|pe ratio|price to earnings|price-to-earnings)(?!\w)", re.I)
+INDICATOR_TERMS = re.compile(
+    r"\b(rsi|macd|sma|ema|moving average|bollinger|volatility|technical indicators?|overbought|oversold)\b", re.I)
+BACKTEST_TERMS = re.compile(r"\b(backtest|back-test|back test|would have (performed|done|worked))\b", re.I)
+NEWS_TERMS = re.compile(
+    r"\b(latest|news|today|this week|yesterday|right now|currently|recent|recently|headlines?)\b", re.I)
+DEFINITION_TERMS = re.compile(
+    r"^\s*(what (is|are|does)|define|explain|meaning of|how (does|do)|difference between|describe)\b", re.I)
+# "What is ..." questions about a particular company or index, a price or a pick are not definitions
+NOT_DEFINITION_TERMS = re.compile(
+    r"\b(price|prices|priced at|quote|trading at|worth|buy|sell|invest in|should i|recommend|"
+    r"good stock|best stocks?|target|forecast|outlook|prediction|s&p|nasdaq|dow jones|russell)(?!\w)"
+    r"|\b[A-Z][a-z]+'s\b", re.I)
+# A capitalised word after the first one is usually a company or product name ("revenue of Microsoft")
+NAME_PATTERN = re.compile(r"\s[A-Z][a-z]+")
+
+STRATEGY_TERMS = [
+    (re.compile(r"\bmean[- ]reversion\b|\bmean[- ]revert", re.I), "mean_reversion"),
+    (re.compile(r"\bmomentum\b", re.I), "momentum"),
+    (re.compile(r"\bcross(over|ing)?\b|\bmoving average\b", re.I), "ma_crossover"),
+]
+
+SEED_EXAMPLES: List[Tuple[str, str]] = [
+    ("what is a stock market index", RETRIEVER),
+    ("explain how dividends work", RETRIEVER),
+    ("what does market capitalization mean", RETRIEVER),
+    ("difference between stocks and bonds", RETRIEVER),
+    ("how do options contracts work", RETRIEVER),
+    ("define price to earnings ratio", RETRIEVER),
+    ("what are blue chip stocks", RETRIEVER),
+    ("basics of trading for beginners", RETRIEVER),
+    ("what is short selling", RETRIEVER),
+    ("how does a stop loss order work", RETRIEVER),
+    ("latest news about the stock market", WEB_SEARCH),
+    ("what happened in the markets today", WEB_SEARCH),
+    ("recent headlines on interest rates", WEB_SEARCH),
+    ("why did the nasdaq fall this week", WEB_SEARCH),
+    ("current federal reserve announcement", WEB_SEARCH),
+    ("what is the market sentiment right now", WEB_SEARCH),
+    ("what is the share price of the company", WEB_SEARCH),
+    ("which stocks are good to buy", WEB_SEARCH),
+    ("revenue of the company last quarter", FINANCIALS),
+    ("show me the balance sheet", FINANCIALS),
+    ("net income and earnings per share", FINANCIALS),
+    ("cash flow statement for the company", FINANCIALS),
+    ("profit margin and operating income", FINANCIALS),
+    ("company financials and sales growth", FINANCIALS),
+    ("rsi and macd for these stocks", INDICATORS),
+    ("is the stock overbought", INDICATORS),
+    ("50 day moving average and volatility", INDICATORS),
+    ("bollinger bands for the ticker", INDICATORS),
+    ("technical indicators for the stock", INDICATORS),
+    ("backtest a moving average crossover strategy", BACKTEST),
+    ("how would a momentum strategy have performed", BACKTEST),
+    ("test mean reversion on these stocks historically", BACKTEST),
+    ("sharpe ratio and drawdown of a crossover strategy", BACKTEST),
+    ("simulate the strategy returns over past data", BACKTEST),
+]
+
+
+class RouteDecision(NamedTuple):
+    tool_name: str
+    args: Dict
+    confidence: float
+    source: str  # "rules" or "classifier"
+
+
+def extract_tickers(question: str) -> List[str]:
+    tickers = []
+    for match in TICKER_PATTERN.finditer(question):
+        symbol = match.group(1) or match.group(2)
+        if symbol not in NOT_TICKERS and symbol not in tickers:
+            tickers.append(symbol)
+    return tickers
+
+
+def _features(text: str) -> List[str]:
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    return tokens + [f"{a}_{b}" for a, b in zip(tokens, tokens[1:])]
+
+
+class NaiveBayesClassifier:
+    """Multinomial naive Bayes over unigrams and bigrams with Laplace smoothing."""
+
+    def __init__(self, examples: Iterable[Tuple[str, str]] = SEED_EXAMPLES, alpha: float = 1.0):
+        self.alpha = alpha
+        self.label_counts: Counter = Counter()
+        self.feature_counts: Dict[str, Counter] = defaultdict(Counter)
+        self.vocabulary = set()
+        for text, label in examples:
+            features = _features(text)
+            self.label_counts[label] += 1
+            self.feature_counts[label].update(features)
+            self.vocabulary.update(features)
+        self.totals = {label: sum(counts.values()) for label, counts in self.feature_counts.items()}
+
+    def predict(self, text: str) -> Tuple[Optional[str], float]:
+        """Most likely label and its posterior probability."""
+        features = [f for f in _features(text) if f in self.vocabulary]
+        if not features:
+            return None, 0.0
+        n_examples = sum(self.label_counts.values())
+        vocab_size = len(self.vocabulary)
+        scores = {}
+        for label, count in self.label_counts.items():
+            denom = self.totals[label] + self.alpha * vocab_size
+            scores[label] = math.log(count / n_examples) + sum(
+                math.log((self.feature_counts[label][f] + self.alpha) / denom) for f in features
+            )
+        best = max(scores, key=scores.get)
+        top = scores[best]
+        posterior = 1.0 / sum(math.exp(score - top) for score in scores.values())
+        return best, posterior
+
+
+class QueryRouter:
+    def __init__(self, confidence_threshold: float = 0.75, classifier: Optional[NaiveBayesClassifier] = None):
+        self.confidence_threshold = confidence_threshold
+        self.classifier = classifier or NaiveBayesClassifier()
+
+    def _tool_args(self, tool_name: str, question: str, tickers: List[str]) -> Optional[Dict]:
+        """Arguments for ``tool_name``, or None when they cannot be derived locally."""
+        if tool_name == RETRIEVER:
+            return {"question": question}
+        if tool_name == WEB_SEARCH:
+            return {"query": question}
+        if tool_name == FINANCIALS:
+            # Polygon financials takes a single ticker
+            return {"query": tickers[0]} if len(tickers) == 1 else None
+        if tool_name == INDICATORS:
+            return {"tickers": tickers} if tickers else None
+        if tool_name == BACKTEST:
+            if not tickers:
+                return None
+            for pattern, strategy in STRATEGY_TERMS:
+                if pattern.search(question):
+                    return {"tickers": tickers, "strategy": strategy}
+            return {"tickers": tickers}
+        return None
+
+    def _rules(self, question: str, tickers: List[str]) -> Optional[Tuple[str, float]]:
+        if tickers and BACKTEST_TERMS.search(question):
+            return BACKTEST, 0.95
+        if tickers and INDICATOR_TERMS.search(question):
+            return INDICATORS, 0.9
+        if len(tickers) == 1 and FINANCIAL_TERMS.search(question) and not NEWS_TERMS.search(question):
+            return FINANCIALS, 0.9
+        if NEWS_TERMS.search(question):
+            return WEB_SEARCH, 0.85
+        if not tickers and DEFINITION_TERMS.search(question):
+            return RETRIEVER, 0.85
+        return None
+
+    @staticmethod
+    def _is_general_question(question: str, tickers: List[str]) -> bool:
+        """False for questions about a named security, company, price or a tool's subject matter.
+
+        Those go to the LLM rather than the docs: a confident misroute to the
+        retriever costs more calls than the router saves.
+        """
+        if tickers or NOT_DEFINITION_TERMS.search(question) or NAME_PATTERN.search(question.strip()):
+            return False
+        return not QueryRouter._term_tools(question)
+
+    @staticmethod
+    def _term_tools(question: str) -> set:
+        """Tools whose subject-matter terms appear in ``question``."""
+        return {tool for terms, tool in ((FINANCIAL_TERMS, FINANCIALS), (INDICATOR_TERMS, INDICATORS),
+                                         (BACKTEST_TERMS, BACKTEST)) if terms.search(question)}
+
+    def route(self, question: str, available_tools: Optional[Iterable[str]] = None) -> Optional[RouteDecision]:
+        """Return a confident tool call for ``question``, or None to defer to the LLM."""
+        available = set(available_tools) if available_tools is not None else None
+        tickers = extract_tickers(question)
+
+        candidates = []
+        rule = self._rules(question, tickers)
+        if rule:
+            candidates.append((rule[0], rule[1], "rules"))
+        label, posterior = self.classifier.predict(question)
+        if label:
+            candidates.append((label, posterior, "classifier"))
+
+        for tool_name, confidence, source in candidates:
+            if confidence < self.confidence_threshold:
+                continue
+            if available is not None and tool_name not in available:
+                continue
+            if tool_name == RETRIEVER and not self._is_general_question(question, tickers):
+                continue
+            # The classifier only sees word statistics; it may not overrule another tool's vocabulary
+            term_tools = self._term_tools(question)
+            if source == "classifier" and term_tools and tool_name not in term_tools:
+                continue
+            args = self._tool_args(tool_name, question, tickers)
+            if args is not None:
+                return RouteDecision(tool_name, args, confidence, source)
+        return None
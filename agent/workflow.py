@@ -1,25 +1,51 @@
+from uuid import uuid4
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
-from typing_extensions import Annotated, TypedDict
-from langgraph.prebuilt.tool_node import ToolNode, tools_condition 
+from typing_extensions import Annotated, NotRequired, TypedDict
+from langgraph.prebuilt.tool_node import ToolNode, tools_condition
 from langchain_core.messages import AIMessage, HumanMessage
 from utils.model_loaders import ModelLoader
-from toolkit.tools import * 
+from utils.config_loader import get_config
+from agent.router import QueryRouter
+from toolkit.tools import *
 
 class State(TypedDict):
     messages: Annotated[list, add_messages]
+    llm_calls: NotRequired[int]
 
 class GraphBuilder:
     def __init__(self):
         self.model_loader = ModelLoader()
         self.llm = self.model_loader.load_llm()
-        self.tools = [retriever_tool, financials_tool, tavily_tool]
+        self.tools = [retriever_tool, backtest_tool, financials_tool, tavily_tool, technical_indicators_tool]
         llm_with_tools = self.llm.bind_tools(tools=self.tools)
         self.llm_with_tools = llm_with_tools
+        self.router = QueryRouter(get_config().router.confidence_threshold)
         self.graph = None
-    
+
+    def _router_node(self, state: State):
+        """Call the tool directly when the local router is confident, skipping the tool-selection LLM call."""
+        question = next(
+            (m.content for m in reversed(state["messages"]) if isinstance(m, HumanMessage)), None
+        )
+        if not isinstance(question, str):
+            return {}
+        self.router.confidence_threshold = get_config().router.confidence_threshold
+        decision = self.router.route(question, [t.name for t in self.tools])
+        if decision is None:
+            return {}
+        tool_call = {"name": decision.tool_name, "args": decision.args, "id": f"router_{uuid4().hex}"}
+        return {"messages": [AIMessage(content="", tool_calls=[tool_call])]}
+
+    def _after_router(self, state: State):
+        last_message = state["messages"][-1]
+        return "tools" if getattr(last_message, "tool_calls", None) else "chatbot"
+
     def _chatbot_node(self, state: State):
-        return {"messages": [self.llm_with_tools.invoke(state["messages"])]}
+        llm_calls = state.get("llm_calls", 0) + 1
+        # On the last allowed iteration, answer with what we have instead of calling more tools
+        llm = self.llm if llm_calls >= get_config().router.max_iterations else self.llm_with_tools
+        return {"messages": [llm.invoke(state["messages"])], "llm_calls": llm_calls}
 
     def build(self):
         graph_builder = StateGraph(State)
@@ -29,7 +55,12 @@ class GraphBuilder:
         graph_builder.add_node("tools", tool_node)
 
         graph_builder.add_conditional_edges("chatbot", tools_condition)
-        graph_builder.add_edge(START, "chatbot")
+        if get_config().router.enabled:
+            graph_builder.add_node("router", self._router_node)
+            graph_builder.add_edge(START, "router")
+            graph_builder.add_conditional_edges("router", self._after_router, ["tools", "chatbot"])
+        else:
+            graph_builder.add_edge(START, "chatbot")
         graph_builder.add_edge("tools","chatbot")
 
         self.graph = graph_builder.compile()
@@ -39,5 +70,3 @@ class GraphBuilder:
         if self.graph is None:
             return ValueError("Graph not built. Call build() first.")
         return self.graph
-    
-    
\ No newline at end of file
@@ -0,0 +1,91 @@
+from typing import Dict
+
+import numpy as np
+
+from market_data.indicators import TRADING_DAYS
+
+
+def simple_returns(prices) -> np.ndarray:
+    """Bar-over-bar returns, NaN on the first bar and wherever either price is missing."""
+    prices = np.asarray(prices, dtype=np.float64)
+    prices = prices[np.newaxis, :] if prices.ndim == 1 else prices
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.empty_like(prices)
+        returns[:, 0] = np.nan
+        returns[:, 1:] = prices[:, 1:] / prices[:, :-1] - 1.0
+    return returns
+
+
+def _performance(strategy_returns: np.ndarray, valid: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-row equity curve and risk/return metrics over the valid bars."""
+    equity = np.cumprod(1.0 + strategy_returns, axis=1)
+    drawdown = equity / np.maximum.accumulate(equity, axis=1) - 1.0
+
+    n_valid = np.maximum(valid.sum(axis=1), 1)
+    mean = strategy_returns.sum(axis=1) / n_valid
+    var = np.where(valid, (strategy_returns - mean[:, np.newaxis]) ** 2, 0.0).sum(axis=1) \
+        / np.maximum(n_valid - 1, 1)
+    std = np.sqrt(var)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(TRADING_DAYS), 0.0)
+
+    return {
+        "equity": equity,
+        "total_return": equity[:, -1] - 1.0,
+        "annual_return": equity[:, -1] ** (TRADING_DAYS / n_valid) - 1.0,
+        "annual_volatility": std * np.sqrt(TRADING_DAYS),
+        "sharpe": sharpe,
+        "max_drawdown": drawdown.min(axis=1),
+    }
+
+
+def run_backtest(prices, positions, cost_bps: float = 0.0) -> Dict[str, np.ndarray]:
+    """Vectorized backtest of target positions over a ``(n_tickers, n_bars)`` price matrix.
+
+    ``positions[:, t]`` is the exposure (-1..1) decided on the close of bar
+    ``t`` and therefore held over bar ``t + 1``; NaN positions are flat.
+    ``cost_bps`` is charged on every unit of position change.
+
+    Returns per-ticker metrics (1-D arrays) plus the per-bar strategy returns
+    and equity curves (2-D arrays).
+    """
+    returns = simple_returns(prices)
+    positions = np.nan_to_num(np.asarray(positions, dtype=np.float64).reshape(returns.shape))
+
+    held = np.zeros_like(positions)
+    held[:, 1:] = positions[:, :-1]
+    trades = np.abs(np.diff(held, axis=1, prepend=0.0))
+
+    valid = ~np.isnan(returns)
+    strategy_returns = np.where(valid, held * np.nan_to_num(returns) - trades * cost_bps / 1e4, 0.0)
+
+    result = _performance(strategy_returns, valid)
+    n_valid = np.maximum(valid.sum(axis=1), 1)
+    result.update({
+        "strategy_returns": strategy_returns,
+        "valid": valid,
+        "exposure": np.where(valid, held != 0, False).sum(axis=1) / n_valid,
+        "trades": (trades > 0).sum(axis=1),
+    })
+    return result
+
+
+def summarize(result: Dict[str, np.ndarray]) -> Dict[str, float]:
+    """Equal-weight, daily-rebalanced portfolio summary of a multi-ticker backtest.
+
+    Each bar's portfolio return is the mean over the tickers that have a
+    return on that bar, so tickers that start trading later do not dilute
+    the earlier bars with zeros.
+    """
+    strategy_returns, valid = result["strategy_returns"], result["valid"]
+    n_live = valid.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        portfolio_returns = np.where(n_live > 0, strategy_returns.sum(axis=0) / n_live, 0.0)
+    portfolio = _performance(portfolio_returns[np.newaxis, :], (n_live > 0)[np.newaxis, :])
+    return {
+        "total_return": float(portfolio["total_return"][0]),
+        "annual_return": float(portfolio["annual_return"][0]),
+        "sharpe": float(portfolio["sharpe"][0]),
+        "max_drawdown": float(portfolio["max_drawdown"][0]),
+        "mean_ticker_sharpe": float(result["sharpe"].mean()),
+    }
@@ -0,0 +1,69 @@
+"""Signal-based strategies.
+
+Each strategy maps a ``(n_tickers, n_bars)`` close-price matrix to target
+positions of the same shape (1 long, -1 short, 0 flat), decided on each bar's
+close. Window parameters may arrive as floats (e.g. from a tool call) and are
+truncated to ints.
+"""
+import numpy as np
+
+from market_data import indicators
+
+
+def _forward_fill(signal: np.ndarray) -> np.ndarray:
+    """Carry the last non-NaN value of each row forward; leading NaNs become 0."""
+    idx = np.where(np.isnan(signal), 0, np.arange(signal.shape[1]))
+    np.maximum.accumulate(idx, axis=1, out=idx)
+    filled = np.take_along_axis(signal, idx, axis=1)
+    return np.nan_to_num(filled)
+
+
+def _finalize(positions: np.ndarray, warm: np.ndarray, allow_short: bool) -> np.ndarray:
+    positions = np.where(warm, 0.0, positions)
+    return positions if allow_short else np.clip(positions, 0.0, None)
+
+
+def ma_crossover(prices, fast: int = 20, slow: int = 50, allow_short: bool = False) -> np.ndarray:
+    """Long while the fast SMA is above the slow SMA."""
+    fast_ma = indicators.sma(prices, int(fast))
+    slow_ma = indicators.sma(prices, int(slow))
+    return _finalize(np.sign(fast_ma - slow_ma), np.isnan(slow_ma) | np.isnan(fast_ma), allow_short)
+
+
+def momentum(prices, lookback: int = 126, allow_short: bool = False) -> np.ndarray:
+    """Long when the trailing ``lookback``-bar return is positive."""
+    prices = indicators.as_matrix(prices)
+    lookback = max(1, int(lookback))
+    trailing = np.full_like(prices, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        trailing[:, lookback:] = prices[:, lookback:] / prices[:, :-lookback] - 1.0
+    return _finalize(np.sign(trailing), np.isnan(trailing), allow_short)
+
+
+def mean_reversion(prices, window: int = 20, entry_z: float = 2.0, exit_z: float = 0.5,
+                   allow_short: bool = True) -> np.ndarray:
+    """Fade moves beyond ``entry_z`` standard deviations; exit inside ``exit_z``.
+
+    Between the entry and exit bands the previous position is held, which is
+    expressed as NaN in the raw signal and then forward-filled.
+    """
+    prices = indicators.as_matrix(prices)
+    bands = indicators.bollinger_bands(prices, int(window), 1.0)
+    std = bands["upper"] - bands["middle"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = (prices - bands["middle"]) / std
+
+    signal = np.full_like(prices, np.nan)
+    signal[np.abs(z) <= exit_z] = 0.0
+    signal[z >= entry_z] = -1.0
+    signal[z <= -entry_z] = 1.0
+    warm = np.isnan(bands["middle"])
+    signal[warm] = 0.0
+    return _finalize(_forward_fill(signal), warm, allow_short)
+
+
+STRATEGIES = {
+    "ma_crossover": ma_crossover,
+    "momentum": momentum,
+    "mean_reversion": mean_reversion,
+}
@@ -0,0 +1,62 @@
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from backtesting.engine import run_backtest, summarize
+from backtesting.strategies import STRATEGIES
+from custom_logging.my_logger import logger
+
+# Price matrix of the current sweep, installed once per worker process by
+# _init_worker so that tasks only carry their parameter dict.
+_worker_prices: Optional[np.ndarray] = None
+
+
+def parameter_grid(**param_values: Iterable) -> List[Dict]:
+    """Cartesian product of parameter values, e.g. ``parameter_grid(fast=[10, 20], slow=[50, 100])``."""
+    names = list(param_values)
+    return [dict(zip(names, combo)) for combo in itertools.product(*param_values.values())]
+
+
+def _init_worker(prices: np.ndarray):
+    global _worker_prices
+    _worker_prices = prices
+
+
+def _evaluate(strategy: str, params: Dict, cost_bps: float, prices: Optional[np.ndarray] = None) -> Dict:
+    prices = _worker_prices if prices is None else prices
+    positions = STRATEGIES[strategy](prices, **params)
+    summary = summarize(run_backtest(prices, positions, cost_bps))
+    return {"params": params, **summary}
+
+
+def run_sweep(prices, strategy: str, grid: List[Dict], cost_bps: float = 0.0,
+              max_workers: Optional[int] = None) -> List[Dict]:
+    """Backtest ``strategy`` once per parameter set in ``grid``, best Sharpe first.
+
+    Parameter sets are spread across a process pool; each evaluation is a
+    vectorized backtest of the whole universe. ``max_workers=1`` (or a
+    single-entry grid) runs in-process.
+
+    Workers are started through a forkserver rather than forked from the
+    caller: the API server is multi-threaded, and a fork taken while another
+    thread holds a lock (logging, HTTP pools, SQLite) deadlocks the child.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}'. Choose from {list(STRATEGIES)}")
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    workers = min(max_workers or os.cpu_count() or 1, len(grid))
+
+    logger.info(f"🧮 Sweeping {len(grid)} parameter sets of {strategy} on {prices.shape} with {workers} workers")
+    if workers <= 1:
+        results = [_evaluate(strategy, params, cost_bps, prices) for params in grid]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("forkserver"),
+                                 initializer=_init_worker, initargs=(prices,)) as pool:
+            futures = [pool.submit(_evaluate, strategy, params, cost_bps) for params in grid]
+            results = [future.result() for future in futures]
+
+    return sorted(results, key=lambda r: r["sharpe"], reverse=True)
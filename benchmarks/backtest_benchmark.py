@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Backtesting benchmarks: single runs over large universes / long date ranges,
+and parameter sweeps with an increasing number of worker processes.
+
+``--check`` compares run_backtest and summarize against a plain per-bar
+loop (position lag, transaction costs, Sharpe, drawdown, NaN-padded rows)
+and exits non-zero on a mismatch.
+
+Run from the repository root:
+    python -m benchmarks.backtest_benchmark
+    python -m benchmarks.backtest_benchmark --check
+"""
+
+import argparse
+import math
+import sys
+import time
+
+import numpy as np
+
+from backtesting.engine import run_backtest, summarize
+from backtesting.strategies import STRATEGIES
+from backtesting.sweep import parameter_grid, run_sweep
+from market_data.indicators import TRADING_DAYS
+
+
+def synthetic_prices(n_tickers, n_bars, seed=0):
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(0.0003, 0.015, size=(n_tickers, n_bars))
+    return 100 * np.exp(np.cumsum(log_returns, axis=1))
+
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_single_runs(universes, bar_counts, repeat):
+    print("📊 Single backtest (strategy signals + P&L, drawdown, Sharpe)")
+    print(f"{'tickers':>8} {'bars':>7} {'strategy':>15} {'seconds':>9} {'Mbar/s':>8}")
+    for n_tickers in universes:
+        for n_bars in bar_counts:
+            prices = synthetic_prices(n_tickers, n_bars)
+            for name, strategy in STRATEGIES.items():
+                elapsed = best_of(lambda: run_backtest(prices, strategy(prices), cost_bps=5), repeat)
+                throughput = n_tickers * n_bars / elapsed / 1e6
+                print(f"{n_tickers:>8} {n_bars:>7} {name:>15} {elapsed:>9.3f} {throughput:>8.1f}")
+
+
+def bench_sweep(n_tickers, n_bars, worker_counts):
+    print(f"\n🧮 ma_crossover parameter sweep on {n_tickers} tickers x {n_bars} bars")
+    prices = synthetic_prices(n_tickers, n_bars)
+    grid = parameter_grid(fast=[5, 10, 20, 30], slow=[50, 100, 150, 200])
+    print(f"{'workers':>8} {'configs':>8} {'seconds':>9} {'speedup':>8}")
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        run_sweep(prices, "ma_crossover", grid, cost_bps=5, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {len(grid):>8} {elapsed:>9.3f} {baseline / elapsed:>7.2f}x")
+
+
+def reference_metrics(returns_by_bar):
+    """Loop version of the engine's metrics for one series of per-bar returns (None = no bar)."""
+    equity, peak, max_drawdown = 1.0, 1.0, 0.0
+    valid = [r for r in returns_by_bar if r is not None]
+    for r in returns_by_bar:
+        equity *= 1 + (r or 0.0)
+        peak = max(peak, equity)
+        max_drawdown = min(max_drawdown, equity / peak - 1)
+    mean = sum(valid) / max(len(valid), 1)
+    std = math.sqrt(sum((r - mean) ** 2 for r in valid) / max(len(valid) - 1, 1))
+    sharpe = mean / std * math.sqrt(TRADING_DAYS) if std > 0 else 0.0
+    return {"total_return": equity - 1, "sharpe": sharpe, "max_drawdown": max_drawdown}
+
+
+def reference_backtest(prices, positions, cost_bps):
+    """Per-ticker, per-bar loop: a position decided on bar t is held over bar t + 1."""
+    per_ticker, per_bar = [], []
+    for p, pos in zip(prices, positions):
+        held_prev, bars, trades = 0.0, [], 0
+        for t in range(len(p)):
+            held = 0.0 if t == 0 or math.isnan(pos[t - 1]) else pos[t - 1]
+            trade = abs(held - held_prev)
+            held_prev = held
+            trades += trade > 0
+            if t == 0 or math.isnan(p[t]) or math.isnan(p[t - 1]):
+                bars.append(None)
+            else:
+                bars.append(held * (p[t] / p[t - 1] - 1) - trade * cost_bps / 1e4)
+        per_ticker.append({**reference_metrics(bars), "trades": trades})
+        per_bar.append(bars)
+
+    # Equal-weight portfolio over the tickers that have a return on each bar
+    portfolio = []
+    for t in range(prices.shape[1]):
+        live = [bars[t] for bars in per_bar if bars[t] is not None]
+        portfolio.append(sum(live) / len(live) if live else None)
+    return per_ticker, reference_metrics(portfolio)
+
+
+def check(tolerance=1e-9):
+    """Compare the vectorized engine with the reference loop; returns the number of failures."""
+    rng = np.random.default_rng(3)
+    prices = synthetic_prices(6, 400, seed=3)
+    prices[1, :120] = np.nan   # listed later
+    prices[4, :7] = np.nan
+    positions = rng.choice([-1.0, -0.5, 0.0, 0.5, 1.0, np.nan], size=prices.shape)
+    failures = 0
+    print("Backtest checks against a per-bar loop")
+    for cost_bps in (0.0, 5.0, 50.0):
+        result = run_backtest(prices, positions, cost_bps)
+        portfolio = summarize(result)
+        per_ticker, expected_portfolio = reference_backtest(prices, positions, cost_bps)
+        errors = []
+        for name in ("total_return", "sharpe", "max_drawdown", "trades"):
+            expected = np.array([metrics[name] for metrics in per_ticker], dtype=np.float64)
+            errors.append(float(np.max(np.abs(result[name] - expected))))
+        for name in ("total_return", "sharpe", "max_drawdown"):
+            errors.append(abs(portfolio[name] - expected_portfolio[name]))
+        failures += max(errors) > tolerance
+        print(f"  cost_bps={cost_bps:<5} max abs err {max(errors):.1e}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--universes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--bars", type=int, nargs="+", default=[252, 2520, 5040])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--sweep-tickers", type=int, default=1000)
+    parser.add_argument("--sweep-bars", type=int, default=2520)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--check", action="store_true", help="verify against a reference loop and exit")
+    args = parser.parse_args()
+
+    if args.check:
+        failures = check()
+        print("all checks passed" if not failures else f"{failures} checks FAILED")
+        sys.exit(1 if failures else 0)
+
+    bench_single_runs(args.universes, args.bars, args.repeat)
+    bench_sweep(args.sweep_tickers, args.sweep_bars, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Bytes on the wire before/after moving chunk text into the local chunk store.
+
+Builds 1000-character chunks the way the ingestion pipeline does, then
+compares the JSON size of Pinecone upsert requests and query responses when
+vectors carry the full text plus PyPDFLoader metadata (before) versus only
+the chunk ID and small metadata (after). Also reports the local store's
+on-disk size and read latency.
+
+Run from the repository root:
+    python -m benchmarks.chunk_store_benchmark
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import uuid
+
+from data_ingestion.chunk_store import ChunkStore, vector_metadata
+
+WORDS = (
+    "stock market index price earnings ratio dividend yield investor portfolio risk return "
+    "volatility bond equity share capital trading broker order limit stop loss margin "
+    "liquidity valuation growth value sector fund exchange asset allocation interest rate "
+    "inflation revenue profit quarter analyst forecast momentum trend support resistance"
+).split()
+
+
+def make_chunks(n_chunks, chunk_size=1000, seed=0):
+    rng = random.Random(seed)
+    chunks = []
+    for i in range(n_chunks):
+        text = ""
+        while len(text) < chunk_size:
+            text += rng.choice(WORDS) + (". " if rng.random() < 0.08 else " ")
+        metadata = {
+            "producer": "Microsoft® Word for Microsoft 365",
+            "creator": "Microsoft® Word for Microsoft 365",
+            "creationdate": "2024-03-11T10:22:41+05:30",
+            "moddate": "2024-03-11T10:22:41+05:30",
+            "source": "/tmp/tmpk2v9x1qz.pdf",
+            "total_pages": 42,
+            "page": i // 3,
+            "page_label": str(i // 3 + 1),
+        }
+        chunks.append((str(uuid.uuid4()), text[:chunk_size], metadata))
+    return chunks
+
+
+def fake_embedding(rng, dim):
+    return [round(rng.uniform(-0.1, 0.1), 8) for _ in range(dim)]
+
+
+def json_size(payload):
+    return len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--dimension", type=int, default=768)
+    parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    chunks = make_chunks(args.chunks)
+    embeddings = [fake_embedding(rng, args.dimension) for _ in chunks]
+
+    before_vectors = [
+        {"id": cid, "values": values, "metadata": {**meta, "text": text}}
+        for (cid, text, meta), values in zip(chunks, embeddings)
+    ]
+    after_vectors = [
+        {"id": cid, "values": values, "metadata": vector_metadata(meta)}
+        for (cid, text, meta), values in zip(chunks, embeddings)
+    ]
+    upsert_before = json_size({"vectors": before_vectors})
+    upsert_after = json_size({"vectors": after_vectors})
+
+    def query_response(vectors):
+        return {"matches": [{"id": v["id"], "score": 0.83, "metadata": v["metadata"]}
+                            for v in vectors[:args.top_k]], "namespace": ""}
+    query_before = json_size(query_response(before_vectors))
+    query_after = json_size(query_response(after_vectors))
+    values_bytes = json_size([v["values"] for v in after_vectors])
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ChunkStore(root)
+        start = time.perf_counter()
+        store.put_many((cid, text) for cid, text, _ in chunks)
+        write_s = time.perf_counter() - start
+        disk = sum(os.path.getsize(os.path.join(root, name)) for name in os.listdir(root))
+
+        ids = [cid for cid, _, _ in chunks]
+        sample = [ids[rng.randrange(len(ids))] for _ in range(args.top_k)]
+        reader = ChunkStore(root)
+        reader.get_many(sample)
+        start = time.perf_counter()
+        for _ in range(1000):
+            reader.get_many(sample)
+        read_us = (time.perf_counter() - start) / 1000 * 1e6
+    raw_text = sum(len(text.encode("utf-8")) for _, text, _ in chunks)
+
+    def row(label, before, after):
+        print(f"{label:<34} {before:>12,} {after:>12,} {1 - after / before:>8.1%}")
+
+    print(f"{args.chunks} chunks, {args.dimension}-d vectors, top_k={args.top_k}\n")
+    print(f"{'':<34} {'before':>12} {'after':>12} {'saved':>8}")
+    row("upsert payload (bytes)", upsert_before, upsert_after)
+    row("upsert payload excl. values", upsert_before - values_bytes, upsert_after - values_bytes)
+    row("query response (bytes)", query_before, query_after)
+    print(f"\nlocal chunk store: {raw_text:,} text bytes -> {disk:,} on disk "
+          f"({raw_text / disk:.1f}x), write {write_s * 1e3:.0f} ms, "
+          f"read top_k {read_us:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
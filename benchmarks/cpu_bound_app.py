@@ -0,0 +1,38 @@
+"""
+CPU-bound ASGI target for worker_scaling_benchmark.
+
+``GET /cpu`` does the local, GIL-holding work the real app does per
+request, with no network calls: it routes every benchmark question through
+the fast-path router and backtests a moving-average crossover over a
+100-ticker synthetic universe. Requests therefore saturate a worker's CPU,
+unlike ``/health``, so throughput shows how well extra workers scale.
+
+Built on Starlette (FastAPI's ASGI core) so it needs no API keys:
+    gunicorn -c gunicorn.conf.py benchmarks.cpu_bound_app:app
+"""
+
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from agent.router import QueryRouter
+from backtesting.engine import run_backtest, summarize
+from backtesting.strategies import STRATEGIES
+from benchmarks.backtest_benchmark import synthetic_prices
+from benchmarks.router_benchmark import HELD_OUT, QUESTIONS
+
+router = QueryRouter()
+prices = synthetic_prices(100, 500)
+
+
+async def cpu(request):
+    routed = sum(router.route(question) is not None for question, _ in QUESTIONS + HELD_OUT)
+    summary = summarize(run_backtest(prices, STRATEGIES["ma_crossover"](prices), cost_bps=5))
+    return JSONResponse({"routed": routed, "sharpe": summary["sharpe"]})
+
+
+async def health(request):
+    return JSONResponse({"status": "ok"})
+
+
+app = Starlette(routes=[Route("/cpu", cpu), Route("/health", health)])
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Latency of a technical-indicator query over thousands of tickers.
+
+Fills a temporary OHLCVStore with synthetic daily bars, then times the
+steps technical_indicators_tool runs per request: resolving which tickers
+are stored, stacking their closes with read_matrix, and computing every
+indicator on the matrix. The first query in a fresh store maps the column
+files; later queries reuse the maps.
+
+``--check`` first compares the vectorized indicators against plain per-bar
+loops (including the blocked closed-form EMA on long series and rows
+left-padded with NaN) and exits non-zero on a mismatch.
+
+Run from the repository root:
+    python -m benchmarks.market_data_benchmark --tickers 1000 3000 --bars 500
+    python -m benchmarks.market_data_benchmark --check
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from market_data import indicators
+from market_data.loaders import generate_synthetic
+from market_data.store import OHLCVStore
+
+
+def time_query(store, tickers, lookback):
+    start = time.perf_counter()
+    found = store.existing_tickers(tickers)
+    close = store.read_matrix(found, "close", lookback=lookback)
+    read_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indicators.rsi(close, 14)
+    indicators.macd(close)
+    indicators.bollinger_bands(close, 20)
+    for name in ("sma", "ema", "volatility"):
+        indicators.INDICATORS[name](close, 20)
+    return read_s, time.perf_counter() - start
+
+
+def reference_ema(x, alpha):
+    out = np.empty_like(x)
+    out[0] = x[0]
+    for t in range(1, len(x)):
+        out[t] = alpha * x[t] + (1 - alpha) * out[t - 1]
+    return out
+
+
+def reference_indicators(x, window, rsi_window):
+    """Per-bar loop versions of sma/ema/rsi/bollinger/volatility for one series."""
+    n = len(x)
+    sma = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    vol = np.full(n, np.nan)
+    log_returns = np.diff(np.log(x), prepend=np.log(x[0]))
+    for t in range(window - 1, n):
+        sma[t] = x[t - window + 1:t + 1].mean()
+        std[t] = x[t - window + 1:t + 1].std()
+        if t >= window:
+            vol[t] = log_returns[t - window + 1:t + 1].std(ddof=1) * np.sqrt(indicators.TRADING_DAYS)
+
+    ema = reference_ema(x, 2 / (window + 1))
+    ema[:window - 1] = np.nan
+
+    delta = np.diff(x, prepend=x[0])
+    gain = reference_ema(np.clip(delta, 0, None), 1 / rsi_window)
+    loss = reference_ema(np.clip(-delta, 0, None), 1 / rsi_window)
+    rsi = np.array([100.0 if l == 0 else 100 - 100 / (1 + g / l) for g, l in zip(gain, loss)])
+    rsi[:rsi_window] = np.nan
+    return {"sma": sma, "ema": ema, "rsi": rsi, "bollinger_upper": sma + 2 * std, "volatility": vol}
+
+
+def vectorized_indicators(prices, window, rsi_window):
+    return {
+        "sma": indicators.sma(prices, window),
+        "ema": indicators.ema(prices, window),
+        "rsi": indicators.rsi(prices, rsi_window),
+        "bollinger_upper": indicators.bollinger_bands(prices, window)["upper"],
+        "volatility": indicators.rolling_volatility(prices, window),
+    }
+
+
+def max_relative_error(actual, expected):
+    if not np.array_equal(np.isnan(actual), np.isnan(expected)):
+        return np.inf
+    valid = ~np.isnan(expected)
+    return float(np.max(np.abs(actual[valid] - expected[valid]) / np.maximum(np.abs(expected[valid]), 1e-12),
+                        initial=0.0))
+
+
+def check(tolerance=1e-9):
+    """Compare indicators with reference loops; returns the number of failures."""
+    rng = np.random.default_rng(7)
+    failures = 0
+    print("Indicator checks against per-bar loops")
+
+    # Blocked closed-form EMA over series much longer than one block
+    for n_bars in (10, 1000, 20000):
+        x = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, size=(3, n_bars)), axis=1))
+        for alpha in (2 / 3, 2 / 21, 1 / 14, 2 / 201):
+            expected = np.array([reference_ema(row, alpha) for row in x])
+            error = max_relative_error(indicators._ewm(x, alpha), expected)
+            failures += error > tolerance
+            print(f"  ewm  bars={n_bars:<6} alpha={alpha:.4f} rel err {error:.1e}")
+
+    x = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, size=(4, 300)), axis=1))
+    full = vectorized_indicators(x, 20, 14)
+    padded = np.concatenate([np.full((4, 37), np.nan), x], axis=1)
+    padded_result = vectorized_indicators(padded, 20, 14)
+    for name in full:
+        expected = np.array([reference_indicators(row, 20, 14)[name] for row in x])
+        error = max_relative_error(full[name], expected)
+        # NaN padding must shift the output, not change it
+        pad_error = max_relative_error(padded_result[name][:, 37:], full[name])
+        pad_ok = np.isnan(padded_result[name][:, :37]).all()
+        failures += error > tolerance or pad_error > tolerance or not pad_ok
+        print(f"  {name:<16} rel err {error:.1e}, padded rel err {pad_error:.1e}, "
+              f"padding NaN {'ok' if pad_ok else 'FAILED'}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tickers", type=int, nargs="+", default=[100, 1000, 3000])
+    parser.add_argument("--bars", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="verify against reference loops and exit")
+    args = parser.parse_args()
+
+    if args.check:
+        failures = check()
+        print("all checks passed" if not failures else f"{failures} checks FAILED")
+        sys.exit(1 if failures else 0)
+
+    print(f"{args.bars} bars per ticker, best of {args.repeat} warm queries")
+    print(f"{'tickers':>8} {'cold read ms':>13} {'read ms':>9} {'indicators ms':>14} {'total ms':>9}")
+    for n_tickers in args.tickers:
+        with tempfile.TemporaryDirectory() as root:
+            tickers = [f"T{i:05d}" for i in range(n_tickers)]
+            generate_synthetic(OHLCVStore(root), tickers, n_days=args.bars)
+
+            store = OHLCVStore(root)
+            cold_read, _ = time_query(store, tickers, args.bars)
+            warm = [time_query(store, tickers, args.bars) for _ in range(args.repeat)]
+            read_s = min(r for r, _ in warm)
+            indicator_s = min(i for _, i in warm)
+            print(f"{n_tickers:>8} {cold_read * 1e3:>13.1f} {read_s * 1e3:>9.1f} "
+                  f"{indicator_s * 1e3:>14.1f} {(read_s + indicator_s) * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
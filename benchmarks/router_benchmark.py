@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Count LLM calls saved by the fast-path query router on a labelled question set.
+
+Without the router every tool question costs two LLM calls (pick the tool,
+then answer from its result) and a no-tool question costs one. A routed
+question skips the tool-selection call. Misroutes are reported separately;
+they still cost one call but may need a follow-up tool call from the LLM.
+
+QUESTIONS were written alongside the rules and seed examples. HELD_OUT
+questions were written afterwards without looking at them, to show how
+the router does on phrasing it was not tuned for.
+
+Run from the repository root:
+    python -m benchmarks.router_benchmark
+"""
+
+import argparse
+import time
+
+from agent.router import BACKTEST, FINANCIALS, INDICATORS, RETRIEVER, WEB_SEARCH, QueryRouter
+
+# (question, tool the LLM would pick, or None when it answers directly)
+QUESTIONS = [
+    ("What was AAPL revenue last quarter?", FINANCIALS),
+    ("Show me the balance sheet for MSFT", FINANCIALS),
+    ("How much net income did TSLA report?", FINANCIALS),
+    ("What are NVDA earnings per share and profit margin?", FINANCIALS),
+    ("Give me the cash flow statement of AMZN", FINANCIALS),
+    ("What is a limit order?", RETRIEVER),
+    ("Explain the difference between a bull and a bear market", RETRIEVER),
+    ("Define dividend yield", RETRIEVER),
+    ("How does margin trading work?", RETRIEVER),
+    ("What are index funds?", RETRIEVER),
+    ("What is diversification in investing?", RETRIEVER),
+    ("Latest news on the Federal Reserve rate decision", WEB_SEARCH),
+    ("Why is the market down today?", WEB_SEARCH),
+    ("What are the recent headlines about oil prices?", WEB_SEARCH),
+    ("Any news about GOOGL this week?", WEB_SEARCH),
+    ("What is the RSI of AAPL and MSFT?", INDICATORS),
+    ("Is TSLA overbought right now based on technical indicators?", INDICATORS),
+    ("Show the MACD and Bollinger bands for NVDA", INDICATORS),
+    ("What is the 20 day volatility of SPY?", INDICATORS),
+    ("Backtest a moving average crossover on AAPL", BACKTEST),
+    ("How would a momentum strategy have performed on MSFT and GOOGL?", BACKTEST),
+    ("Backtest mean reversion on XOM", BACKTEST),
+    ("Hello, who are you?", None),
+    ("Thanks, that was helpful", None),
+    ("Summarize what you just told me", None),
+    ("Write a short poem about investing", None),
+]
+
+HELD_OUT = [
+    ("What is Apple's stock price?", WEB_SEARCH),
+    ("What is a good stock to buy now?", WEB_SEARCH),
+    ("What is the S&P 500 RSI?", INDICATORS),
+    ("What is the P/E ratio of AAPL?", FINANCIALS),
+    ("Is it a good time to buy MSFT?", WEB_SEARCH),
+    ("What is going on with NVDA?", WEB_SEARCH),
+    ("What's the outlook for gold prices?", WEB_SEARCH),
+    ("How have bank stocks been doing lately?", WEB_SEARCH),
+    ("Which sectors are hot in the market?", WEB_SEARCH),
+    ("Is Meta making money?", FINANCIALS),
+    ("How much debt does AMD carry?", FINANCIALS),
+    ("Tell me about compound interest", RETRIEVER),
+    ("Can you walk me through how bonds are priced?", RETRIEVER),
+    ("Tell me about risk parity portfolios", RETRIEVER),
+    ("What should I know before opening a brokerage account?", RETRIEVER),
+    ("Is QQQ trending above its 200 day average?", INDICATORS),
+    ("Run a historical simulation of trend following on QQQ", BACKTEST),
+    ("Would buying dips in KO have made money over the last years?", BACKTEST),
+    ("Can you help me?", None),
+    ("What do you think about that?", None),
+    ("What is the revenue of Microsoft?", FINANCIALS),
+    ("What is Nvidia profit margin?", FINANCIALS),
+    ("What are Amazon earnings this year?", FINANCIALS),
+    ("What is the RSI of Apple?", INDICATORS),
+    ("Describe Tesla balance sheet", FINANCIALS),
+    ("What is Apple stock doing?", WEB_SEARCH),
+]
+
+
+def evaluate(router, questions, verbose):
+    """LLM calls without and with the router, plus correct and misrouted counts."""
+    baseline_calls = routed_calls = correct = wrong = 0
+    for question, expected in questions:
+        decision = router.route(question)
+        baseline = 2 if expected else 1
+        baseline_calls += baseline
+        if decision is None:
+            routed_calls += baseline
+            outcome = "deferred"
+        elif decision.tool_name == expected:
+            routed_calls += 1
+            correct += 1
+            outcome = f"routed ({decision.source}, {decision.confidence:.2f})"
+        else:
+            # One call to answer plus, at worst, the LLM picking the right tool and answering again
+            routed_calls += 1 + baseline
+            wrong += 1
+            outcome = f"MISROUTED to {decision.tool_name}"
+        if verbose:
+            print(f"{outcome:<32} {question}")
+    return baseline_calls, routed_calls, correct, wrong
+
+
+def report(name, questions, baseline_calls, routed_calls, correct, wrong):
+    n = len(questions)
+    print(f"{name}")
+    print(f"  questions:                {n}")
+    print(f"  routed correctly:         {correct}")
+    print(f"  misrouted:                {wrong}")
+    print(f"  LLM calls without router: {baseline_calls} ({baseline_calls / n:.2f} per query)")
+    print(f"  LLM calls with router:    {routed_calls} ({routed_calls / n:.2f} per query)")
+    print(f"  LLM calls saved:          {baseline_calls - routed_calls} "
+          f"({(baseline_calls - routed_calls) / baseline_calls:.0%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threshold", type=float, default=0.75)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    router = QueryRouter(args.threshold)
+    start = time.perf_counter()
+    for name, questions in (("tuning set", QUESTIONS), ("held-out set", HELD_OUT)):
+        report(name, questions, *evaluate(router, questions, args.verbose))
+    elapsed = time.perf_counter() - start
+    print(f"router time per query:      {elapsed / (len(QUESTIONS) + len(HELD_OUT)) * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Measure Streamlit UI rerun time against chat history length.
+
+Uses Streamlit's headless AppTest runner, so no browser or backend is needed
+(the health check is cached after the first run either way).
+
+Run from the repository root:
+    python -m benchmarks.streamlit_rerun_benchmark
+"""
+
+import argparse
+import os
+import time
+
+from streamlit.testing.v1 import AppTest
+
+
+def make_history(n_messages):
+    return [
+        {"role": "user" if i % 2 == 0 else "bot",
+         "content": f"Message {i}: what is the outlook for AAPL revenue this quarter? " * 4}
+        for i in range(n_messages)
+    ]
+
+
+def time_reruns(script, n_messages, repeat):
+    app = AppTest.from_file(os.path.abspath(script), default_timeout=30)
+    app.session_state["messages"] = make_history(n_messages)
+    app.run()  # warm caches (pooled session, health check)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script", default="streamlit_ui.py")
+    parser.add_argument("--history", type=int, nargs="+", default=[0, 10, 100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'messages':>9} {'best ms':>9} {'mean ms':>9}")
+    for n_messages in args.history:
+        best, mean = time_reruns(args.script, n_messages, args.repeat)
+        print(f"{n_messages:>9} {best * 1e3:>9.1f} {mean * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
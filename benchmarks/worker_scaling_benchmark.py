@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Throughput of the gunicorn deployment against worker count.
+
+For each worker count, starts ``gunicorn -c gunicorn.conf.py`` on a free
+port, waits for it to answer, then drives it from several client processes
+over keep-alive connections for a fixed duration and reports requests/s.
+
+The default target is ``benchmarks.cpu_bound_app``, whose ``/cpu`` route
+keeps a worker's CPU busy, so the numbers show how throughput scales with
+workers. ``--app main:app --path /health`` measures the real app's
+per-request overhead instead; that route does almost no work and mostly
+shows the cost of the HTTP stack. Speedup is bounded by the number of CPUs.
+
+Run from the repository root:
+    python -m benchmarks.worker_scaling_benchmark --workers 1 2 4
+"""
+
+import argparse
+import http.client
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import time
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_up(port, path, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", path)
+            if conn.getresponse().status < 500:
+                return True
+        except OSError:
+            time.sleep(0.25)
+    return False
+
+
+def client(port, path, duration, results):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    done = errors = 0
+    deadline = time.time() + duration
+    while time.time() < deadline:
+        try:
+            conn.request("GET", path)
+            response = conn.getresponse()
+            response.read()
+            if response.status == 200:
+                done += 1
+            else:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    results.put((done, errors))
+
+
+def run_load(port, path, clients, duration):
+    results = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=client, args=(port, path, duration, results))
+             for _ in range(clients)]
+    for proc in procs:
+        proc.start()
+    totals = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+    return sum(d for d, _ in totals), sum(e for _, e in totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", default="benchmarks.cpu_bound_app:app")
+    parser.add_argument("--path", default="/cpu")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--clients", type=int, default=2 * (os.cpu_count() or 1))
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.clients} client processes, {args.duration:.0f}s per run, "
+          f"GET {args.path} on {args.app}")
+    print(f"{'workers':>8} {'req/s':>10} {'errors':>8} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        port = free_port()
+        env = {**os.environ, "WEB_CONCURRENCY": str(workers), "PORT": str(port)}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+             "--access-logfile", "/dev/null", args.app],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            if not wait_until_up(port, args.path, args.startup_timeout):
+                print(f"{workers:>8} server did not start")
+                continue
+            done, errors = run_load(port, args.path, args.clients, args.duration)
+            rate = done / args.duration
+            baseline = baseline or rate
+            print(f"{workers:>8} {rate:>10.0f} {errors:>8} {rate / baseline:>7.2f}x")
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    main()
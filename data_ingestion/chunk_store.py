@@ -0,0 +1,166 @@
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import zstandard as zstd
+
+from custom_logging.my_logger import logger
+
+# Index record: chunk UUID, segment number, byte offset, compressed length
+INDEX_RECORD = struct.Struct("<16sIQI")
+INDEX_FILE = "index.bin"
+LOCK_FILE = ".lock"
+
+
+def vector_metadata(metadata: dict) -> dict:
+    """The small subset of loader metadata that travels with a vector.
+
+    Chunk text stays in the local ChunkStore; only what is useful for citing
+    or filtering a match is sent to the vector DB.
+    """
+    small = {}
+    if metadata.get("source"):
+        small["source"] = os.path.basename(str(metadata["source"]))
+    if isinstance(metadata.get("page"), int):
+        small["page"] = metadata["page"]
+    return small
+
+
+def _chunk_key(chunk_id: str) -> Optional[bytes]:
+    """Index key of a chunk UUID; None for ids the store cannot hold (e.g. vectors upserted elsewhere)."""
+    try:
+        return uuid.UUID(chunk_id).bytes
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+class ChunkStore:
+    """Append-only, zstd-compressed chunk text store keyed by chunk UUID.
+
+    Chunk texts are written as independent zstd frames into segment files
+    (``segment-000001.zst``, ...) that roll over at ``max_segment_bytes``.
+    ``index.bin`` holds fixed-size records pointing into the segments and is
+    appended only after the data it points to, so readers never see a
+    dangling entry. Segments are read through mmap. Writers from several
+    processes are serialized with an flock on ``.lock``.
+    """
+
+    def __init__(self, root_dir: str, max_segment_bytes: int = 64 * 1024 * 1024,
+                 compression_level: int = 3):
+        self.root_dir = root_dir
+        self.max_segment_bytes = max_segment_bytes
+        os.makedirs(self.root_dir, exist_ok=True)
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, Tuple[int, int, int]] = {}
+        self._index_bytes_read = 0
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._refresh_index()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.root_dir, f"segment-{segment:06d}.zst")
+
+    def _refresh_index(self):
+        """Load index records appended (by any process) since the last refresh."""
+        path = os.path.join(self.root_dir, INDEX_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as fh:
+            fh.seek(self._index_bytes_read)
+            data = fh.read()
+        usable = len(data) - len(data) % INDEX_RECORD.size
+        for key, segment, offset, length in INDEX_RECORD.iter_unpack(data[:usable]):
+            self._index[key] = (segment, offset, length)
+        self._index_bytes_read += usable
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, chunk_id: str):
+        key = _chunk_key(chunk_id)
+        return key is not None and key in self._index
+
+    def put_many(self, chunks: Iterable[Tuple[str, str]]) -> int:
+        """Store ``(chunk_id, text)`` pairs. Returns the number of compressed bytes written."""
+        # zstd (de)compressor objects must not be shared between threads
+        compressor = zstd.ZstdCompressor(level=self.compression_level)
+        frames = [(uuid.UUID(chunk_id).bytes, compressor.compress(text.encode("utf-8")))
+                  for chunk_id, text in chunks]
+        if not frames:
+            return 0
+
+        with self._lock, open(os.path.join(self.root_dir, LOCK_FILE), "a") as lock_fh:
+            fcntl.flock(lock_fh, fcntl.LOCK_EX)
+            try:
+                segments = sorted(
+                    int(name[len("segment-"):-len(".zst")]) for name in os.listdir(self.root_dir)
+                    if name.startswith("segment-") and name.endswith(".zst")
+                )
+                segment = segments[-1] if segments else 1
+                records = []
+                written = 0
+                seg_fh = open(self._segment_path(segment), "ab")
+                try:
+                    offset = seg_fh.tell()
+                    for key, frame in frames:
+                        if offset and offset + len(frame) > self.max_segment_bytes:
+                            seg_fh.close()
+                            segment += 1
+                            seg_fh = open(self._segment_path(segment), "ab")
+                            offset = 0
+                        seg_fh.write(frame)
+                        records.append(INDEX_RECORD.pack(key, segment, offset, len(frame)))
+                        offset += len(frame)
+                        written += len(frame)
+                    seg_fh.flush()
+                    os.fsync(seg_fh.fileno())
+                finally:
+                    seg_fh.close()
+
+                with open(os.path.join(self.root_dir, INDEX_FILE), "ab") as index_fh:
+                    # Drop a torn record left by an interrupted writer before appending
+                    torn = index_fh.tell() % INDEX_RECORD.size
+                    if torn:
+                        index_fh.truncate(index_fh.tell() - torn)
+                    index_fh.write(b"".join(records))
+            finally:
+                fcntl.flock(lock_fh, fcntl.LOCK_UN)
+
+            self._refresh_index()
+
+        logger.info(f"🗜️ Stored {len(frames)} chunks ({written} compressed bytes) in {self.root_dir}")
+        return written
+
+    def _segment_map(self, segment: int, end: int) -> mmap.mmap:
+        mapped = self._maps.get(segment)
+        if mapped is None or len(mapped) < end:
+            with open(self._segment_path(segment), "rb") as fh:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[segment] = mapped
+        return mapped
+
+    def get_many(self, chunk_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Texts for ``chunk_ids``; ids that are not in the store (or not UUIDs) map to None."""
+        keys = [_chunk_key(chunk_id) for chunk_id in chunk_ids]
+        if any(key is not None and key not in self._index for key in keys):
+            with self._lock:
+                self._refresh_index()
+
+        decompressor = zstd.ZstdDecompressor()
+        texts = {}
+        for chunk_id, key in zip(chunk_ids, keys):
+            entry = self._index.get(key) if key is not None else None
+            if entry is None:
+                texts[chunk_id] = None
+                continue
+            segment, offset, length = entry
+            frame = self._segment_map(segment, offset + length)[offset:offset + length]
+            texts[chunk_id] = decompressor.decompress(frame).decode("utf-8")
+        return texts
+
+    def get(self, chunk_id: str) -> Optional[str]:
+        return self.get_many([chunk_id])[chunk_id]
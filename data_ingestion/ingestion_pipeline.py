@@ -6,9 +6,9 @@ from dotenv import load_dotenv
 from langchain_core.documents import Document
 from langchain_community.document_loaders import PyPDFLoader, Docx2txtLoader, UnstructuredFileLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_pinecone import PineconeVectorStore
 from utils.model_loaders import ModelLoader
-from utils.config_loader import load_config
+from utils.config_loader import get_config
+from data_ingestion.chunk_store import ChunkStore, vector_metadata
 from pinecone import ServerlessSpec
 from pinecone import Pinecone
 from uuid import uuid4
@@ -19,7 +19,12 @@ class DataIngestion:
         logger.info("🔄 Initializing DataIngestion class...")
         self.model_loader = ModelLoader()
         self._load_env_variables()
-        self.config = load_config()
+        chunk_store_config = get_config().chunk_store
+        self.chunk_store = ChunkStore(
+            chunk_store_config.data_dir,
+            chunk_store_config.max_segment_bytes,
+            chunk_store_config.compression_level,
+        )
         logger.success("✅ DataIngestion initialized successfully")
     
     def _load_env_variables(self):
@@ -101,7 +106,7 @@ class DataIngestion:
             pc = Pinecone(api_key=self.pinecone_api_key)
             logger.success("✅ Connected to Pinecone")
 
-            index_name = self.config["vector_db"]["index_name"]
+            index_name = get_config().vector_db.index_name
             logger.info(f"🔍 Checking for index: {index_name}")
             
             if not pc.has_index(index_name):
@@ -123,19 +128,24 @@ class DataIngestion:
             index = pc.Index(index_name)
             logger.success("✅ Index retrieved successfully")
             
-            logger.info("🔗 Creating vector store...")
-            vector_store = PineconeVectorStore(
-                index=index,
-                embedding=self.model_loader.load_embeddings(),
-            )
-            logger.success("✅ Vector store created")
-            
             logger.info("📝 Generating UUIDs for documents...")
             uuids = [str(uuid4()) for _ in range(len(documents))]
             logger.info(f"✅ Generated {len(uuids)} UUIDs")
-            
-            logger.info("💾 Adding documents to vector store...")
-            vector_store.add_documents(documents=documents, ids=uuids)
+
+            texts = [doc.page_content for doc in documents]
+            logger.info("🗜️ Writing chunk text to local chunk store...")
+            self.chunk_store.put_many(zip(uuids, texts))
+
+            logger.info("🧠 Embedding chunks...")
+            embeddings = self.model_loader.load_embeddings().embed_documents(texts)
+
+            # Vectors carry only their ID and small metadata; text is looked up locally at query time
+            logger.info("💾 Upserting vectors...")
+            vectors = [
+                {"id": chunk_id, "values": values, "metadata": vector_metadata(doc.metadata)}
+                for chunk_id, values, doc in zip(uuids, embeddings, documents)
+            ]
+            index.upsert(vectors=vectors, batch_size=100)
             logger.success(f"✅ Successfully stored {len(documents)} documents in vector DB")
             
             return uuids
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
 from langgraph.graph.message import add_messages
 
 class RagToolSchema(BaseModel):
@@ -6,3 +7,32 @@ class RagToolSchema(BaseModel):
 
 class QuestionRequest(BaseModel):
     question: str
+
+class TechnicalIndicatorSchema(BaseModel):
+    tickers: List[str] = Field(description="Ticker symbols, e.g. ['AAPL', 'MSFT']")
+    indicators: List[str] = Field(
+        default=["sma", "ema", "rsi", "macd", "bollinger", "volatility"],
+        description="Any of: sma, ema, rsi, macd, bollinger, volatility",
+    )
+    window: int = Field(default=20, description="Window for sma, ema, bollinger and volatility")
+    rsi_window: int = Field(default=14, description="Window for rsi")
+    start: Optional[str] = Field(default=None, description="Start date, YYYY-MM-DD")
+    end: Optional[str] = Field(default=None, description="End date, YYYY-MM-DD")
+
+class BacktestSchema(BaseModel):
+    tickers: List[str] = Field(description="Ticker symbols to backtest, e.g. ['AAPL', 'MSFT']")
+    strategy: str = Field(
+        default="ma_crossover",
+        description="One of: ma_crossover, momentum, mean_reversion",
+    )
+    parameters: Dict[str, float] = Field(
+        default={},
+        description="Strategy parameters, e.g. {'fast': 20, 'slow': 50} for ma_crossover, "
+                    "{'lookback': 126} for momentum, {'window': 20, 'entry_z': 2, 'exit_z': 0.5} for mean_reversion",
+    )
+    param_grid: Optional[Dict[str, List[float]]] = Field(
+        default=None,
+        description="Optional parameter sweep, e.g. {'fast': [10, 20], 'slow': [50, 100]}",
+    )
+    start: Optional[str] = Field(default=None, description="Start date, YYYY-MM-DD")
+    end: Optional[str] = Field(default=None, description="End date, YYYY-MM-DD")
@@ -0,0 +1,43 @@
+"""Gunicorn settings for multi-worker serving.
+
+    gunicorn -c gunicorn.conf.py main:app
+
+The app is imported once in the master (preload_app), so config, the
+compiled agent graph, the router classifier and the chunk store index are
+loaded a single time and shared with the forked workers copy-on-write.
+Caches that workers fill at runtime (embeddings, tool results) live in the
+SQLite WAL shared cache instead of per-worker memory.
+
+Each worker holds its own graph and LLM clients, and a parameter sweep in
+backtest_tool starts ``backtest.max_workers`` more processes, so the
+default stays small: the CPUs this process may run on, capped at
+DEFAULT_MAX_WORKERS. Set WEB_CONCURRENCY to run more (or fewer) workers.
+"""
+import gc
+import os
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def _available_cpus():
+    # The affinity mask honours cpusets (docker --cpuset-cpus); cpu_count()
+    # reports every core on the host.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", min(_available_cpus(), DEFAULT_MAX_WORKERS)))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+keepalive = 5
+accesslog = "-"
+
+
+def when_ready(server):
+    # Move everything loaded so far into the permanent generation so the
+    # garbage collector's bookkeeping writes do not un-share those pages.
+    gc.freeze()
+
@@ -2,6 +2,7 @@ from fastapi import FastAPI, UploadFile, File, Request, Form
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List
+from contextlib import asynccontextmanager
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from starlette.background import BackgroundTasks
@@ -10,7 +11,8 @@ from data_ingestion.ingestion_pipeline import DataIngestion
 from agent.workflow import GraphBuilder 
 from data_models.models import *
 from custom_logging.my_logger import logger
-import traceback, os
+from utils.config_loader import get_config_manager, subscribe
+import traceback, os, threading
         
 
 # Add immediate console output
@@ -27,7 +29,45 @@ except Exception as e:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger("TradingBot") 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pick up edits to config/config.yaml without a restart. Started here,
+    # once per serving process, rather than at import: under gunicorn's
+    # preload_app the import runs in the master, which must stay single-threaded
+    # to fork workers safely.
+    get_config_manager().start_watcher()
+    yield
+
+app = FastAPI(lifespan=lifespan)
+
+_graph = None
+_graph_lock = threading.Lock()
+
+def get_graph():
+    """Compiled agent graph, built once per process and reused by every request."""
+    global _graph
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                logger.info("🔄 Building graph service...")
+                graph_service = GraphBuilder()
+                graph_service.build()
+                _graph = graph_service.get_graph()
+    return _graph
+
+def _reset_graph(_section):
+    global _graph
+    _graph = None
+
+subscribe("llm", _reset_graph)
+subscribe("router", _reset_graph)
+
+# Build read-only state at import time. Under gunicorn with preload_app this
+# happens once in the master and workers share the pages copy-on-write.
+try:
+    get_graph()
+except Exception as e:
+    logger.warning(f"⚠️ Graph not preloaded, will build on first query: {str(e)}")
 
 app.add_middleware(
     CORSMiddleware,
@@ -74,10 +114,7 @@ async def query_chatbot(question: str = Form(...)):
     logger.info(f"💬 Query request received: {question}")
     
     try:
-        logger.info("🔄 Building graph service...")
-        graph_service = GraphBuilder()
-        graph_service.build()
-        graph = graph_service.get_graph()
+        graph = get_graph()
 
         # Format messages correctly for LangGraph
         from langchain_core.messages import HumanMessage
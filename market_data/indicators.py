@@ -0,0 +1,167 @@
+"""Vectorized technical indicators.
+
+Every function takes a price matrix of shape ``(n_tickers, n_bars)`` (a 1-D
+series is treated as a single ticker) and returns arrays of the same shape,
+with NaN wherever the indicator is still warming up. Rows may be left-padded
+with NaN, as produced by ``OHLCVStore.read_matrix``.
+"""
+from typing import Dict, Tuple
+
+import numpy as np
+
+TRADING_DAYS = 252
+
+
+def as_matrix(prices) -> np.ndarray:
+    prices = np.asarray(prices, dtype=np.float64)
+    return prices[np.newaxis, :] if prices.ndim == 1 else prices
+
+
+def _leading_fill(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Back-fill the NaN padding of each row with its first valid value.
+
+    Returns the filled matrix and the index of the first valid value per row.
+    Recursive filters seeded with a constant prefix equal to their first input
+    give exactly the same output as filters started at that first input.
+    """
+    if x.shape[1] == 0 or not np.isnan(x[:, 0]).any():
+        # No padding to fill; callers never write into the returned matrix
+        return x, np.zeros(x.shape[0], dtype=np.int64)
+    valid = ~np.isnan(x)
+    first = np.where(valid.any(axis=1), valid.argmax(axis=1), x.shape[1])
+    seed = x[np.arange(x.shape[0]), np.minimum(first, x.shape[1] - 1)]
+    cols = np.arange(x.shape[1])
+    filled = np.where(cols < first[:, np.newaxis], seed[:, np.newaxis], x)
+    return filled, first
+
+
+def _warmup_mask(first: np.ndarray, n_bars: int, warmup: int):
+    """True where fewer than ``warmup`` valid bars have been seen.
+
+    When no row is padded this is a plain column slice, which avoids building
+    a full boolean matrix for every indicator.
+    """
+    if not first.any():
+        return (slice(None), slice(0, warmup))
+    return np.arange(n_bars) < (first[:, np.newaxis] + warmup)
+
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    csum = np.cumsum(x, axis=1)
+    out = csum.copy()
+    out[:, window:] = csum[:, window:] - csum[:, :-window]
+    return out
+
+
+def _ewm(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Recursive ``y[t] = alpha * x[t] + (1 - alpha) * y[t-1]`` seeded with ``y[0] = x[0]``.
+
+    Uses the closed form ``y[t] = d**t * (y[-1] + sum_i alpha * x[i] * d**-i)``
+    with ``d = 1 - alpha``, taking ``y[-1] = x[0]``. The scale factor ``d**-i``
+    overflows for long series, so bars are processed in blocks short enough to
+    stay in float64 range, carrying the last value of each block into the next.
+    """
+    n_bars = x.shape[1]
+    decay = 1.0 - alpha
+    if n_bars == 0 or decay <= 0.0:
+        return x.copy()
+    block = max(1, int(500.0 / -np.log(decay)))
+
+    out = np.empty_like(x)
+    carry = x[:, 0]
+    for begin in range(0, n_bars, block):  # a single pass unless n_bars > block
+        chunk = x[:, begin:begin + block]
+        scale = decay ** -np.arange(1, chunk.shape[1] + 1, dtype=np.float64)
+        acc = np.cumsum(alpha * chunk * scale, axis=1)
+        out[:, begin:begin + chunk.shape[1]] = (acc + carry[:, np.newaxis]) / scale
+        carry = out[:, begin + chunk.shape[1] - 1]
+    return out
+
+
+def sma(prices, window: int) -> np.ndarray:
+    x = as_matrix(prices)
+    filled, first = _leading_fill(x)
+    out = _rolling_sum(filled, window) / window
+    out[_warmup_mask(first, x.shape[1], window - 1)] = np.nan
+    return out
+
+
+def ema(prices, window: int) -> np.ndarray:
+    x = as_matrix(prices)
+    filled, first = _leading_fill(x)
+    out = _ewm(filled, 2.0 / (window + 1))
+    out[_warmup_mask(first, x.shape[1], window - 1)] = np.nan
+    return out
+
+
+def rsi(prices, window: int = 14) -> np.ndarray:
+    """Relative Strength Index with Wilder smoothing."""
+    x = as_matrix(prices)
+    filled, first = _leading_fill(x)
+    delta = np.diff(filled, axis=1, prepend=filled[:, :1])
+    gain = _ewm(np.clip(delta, 0, None), 1.0 / window)
+    loss = _ewm(np.clip(-delta, 0, None), 1.0 / window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(loss == 0, 100.0, 100.0 - 100.0 / (1.0 + gain / loss))
+    out[_warmup_mask(first, x.shape[1], window)] = np.nan
+    return out
+
+
+def macd(prices, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    x = as_matrix(prices)
+    filled, first = _leading_fill(x)
+    line = _ewm(filled, 2.0 / (fast + 1)) - _ewm(filled, 2.0 / (slow + 1))
+    signal_line = _ewm(line, 2.0 / (signal + 1))
+    histogram = line - signal_line
+
+    line[_warmup_mask(first, x.shape[1], slow - 1)] = np.nan
+    warm = _warmup_mask(first, x.shape[1], slow + signal - 2)
+    signal_line[warm] = np.nan
+    histogram[warm] = np.nan
+    return {"macd": line, "signal": signal_line, "histogram": histogram}
+
+
+def bollinger_bands(prices, window: int = 20, num_std: float = 2.0) -> Dict[str, np.ndarray]:
+    x = as_matrix(prices)
+    filled, first = _leading_fill(x)
+    # Centre on the first value of each row so the sum of squares stays well conditioned
+    centred = filled - filled[:, :1]
+    mean = _rolling_sum(centred, window) / window
+    var = _rolling_sum(centred * centred, window) / window - mean * mean
+    std = np.sqrt(np.clip(var, 0, None))
+    middle = mean + filled[:, :1]
+
+    warm = _warmup_mask(first, x.shape[1], window - 1)
+    for band in (middle, std):
+        band[warm] = np.nan
+    return {
+        "middle": middle,
+        "upper": middle + num_std * std,
+        "lower": middle - num_std * std,
+    }
+
+
+def rolling_volatility(prices, window: int = 20, annualize: bool = True) -> np.ndarray:
+    """Rolling standard deviation of log returns."""
+    x = as_matrix(prices)
+    filled, first = _leading_fill(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(np.log(filled), axis=1, prepend=np.log(filled[:, :1]))
+    mean = _rolling_sum(returns, window) / window
+    var = _rolling_sum(returns * returns, window) / window - mean * mean
+    # Sample (n - 1) standard deviation, matching the usual definition
+    out = np.sqrt(np.clip(var, 0, None) * window / max(window - 1, 1))
+    if annualize:
+        out *= np.sqrt(TRADING_DAYS)
+    out[_warmup_mask(first, x.shape[1], window)] = np.nan
+    return out
+
+
+INDICATORS = {
+    "sma": sma,
+    "ema": ema,
+    "rsi": rsi,
+    "macd": macd,
+    "bollinger": bollinger_bands,
+    "volatility": rolling_volatility,
+}
@@ -0,0 +1,243 @@
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from custom_logging.my_logger import logger
+
+# Column layout of a ticker directory. Every column is a flat, headerless
+# binary file so new bars can be appended in place and read back as memmaps.
+COLUMNS = {
+    "timestamp": np.dtype("<i8"),   # seconds since epoch (UTC)
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+}
+PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def to_epoch_seconds(value) -> Optional[int]:
+    """Convert a date string / datetime64 / int into epoch seconds."""
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return int(np.datetime64(value, "s").astype(np.int64))
+
+
+def to_epoch_array(values) -> np.ndarray:
+    """Vectorized ``to_epoch_seconds`` for a whole column of timestamps."""
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iu":
+        return arr.astype(COLUMNS["timestamp"], copy=False)
+    return arr.astype("datetime64[s]").astype(COLUMNS["timestamp"])
+
+
+GENERATION_FILE = ".generation"
+
+
+class OHLCVStore:
+    """Local columnar OHLCV store, one directory of memory-mapped columns per ticker.
+
+    Every append atomically replaces ``.generation`` in the store root. Readers
+    stat that single file per query and otherwise serve ticker lookups and
+    column maps from memory, so a query over thousands of tickers costs one
+    ``stat`` instead of one per column.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        os.makedirs(self.root_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._generation = None
+        self._tickers: Optional[frozenset] = None
+        # (ticker, column) -> memmap, valid for the current generation
+        self._maps: Dict[Tuple[str, str], np.ndarray] = {}
+
+    def _column_path(self, ticker: str, column: str) -> str:
+        return os.path.join(self.root_dir, ticker.upper(), f"{column}.bin")
+
+    def _check_generation(self):
+        """Drop cached maps and the ticker list if any process appended since the last check."""
+        try:
+            st = os.stat(os.path.join(self.root_dir, GENERATION_FILE))
+            generation = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            generation = None
+        if generation != self._generation:
+            self._maps = {}
+            self._tickers = None
+            self._generation = generation
+
+    def _bump_generation(self):
+        path = os.path.join(self.root_dir, GENERATION_FILE)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+        with open(tmp_path, "w") as fh:
+            fh.write(str(time.time_ns()))
+        os.replace(tmp_path, path)
+
+    def _ticker_set(self) -> frozenset:
+        if self._tickers is None:
+            self._tickers = frozenset(
+                name for name in os.listdir(self.root_dir)
+                if os.path.isfile(os.path.join(self.root_dir, name, "timestamp.bin"))
+            )
+        return self._tickers
+
+    def tickers(self) -> List[str]:
+        self._check_generation()
+        return sorted(self._ticker_set())
+
+    def has_ticker(self, ticker: str) -> bool:
+        self._check_generation()
+        return ticker.upper() in self._ticker_set()
+
+    def existing_tickers(self, tickers: Iterable[str]) -> List[str]:
+        """The subset of ``tickers`` (upper-cased, order kept) that has stored bars."""
+        self._check_generation()
+        known = self._ticker_set()
+        return [t.upper() for t in tickers if t.upper() in known]
+
+    def _column(self, ticker: str, column: str) -> np.ndarray:
+        key = (ticker.upper(), column)
+        cached = self._maps.get(key)
+        if cached is not None:
+            return cached
+
+        path = self._column_path(ticker, column)
+        dtype = COLUMNS[column]
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return np.empty(0, dtype=dtype)
+        if size < dtype.itemsize:
+            return np.empty(0, dtype=dtype)
+
+        # Plain ndarray view over the map: slicing it skips np.memmap's per-slice overhead
+        mapped = np.memmap(path, dtype=dtype, mode="r", shape=(size // dtype.itemsize,)).view(np.ndarray)
+        self._maps[key] = mapped
+        return mapped
+
+    def length(self, ticker: str) -> int:
+        # Columns are written timestamp-last, so the timestamp column never
+        # runs ahead of the price columns even after an interrupted append.
+        self._check_generation()
+        return len(self._column(ticker, "timestamp"))
+
+    def append(self, ticker: str, timestamps, open_, high, low, close, volume) -> int:
+        """Append bars for a ticker. Bars at or before the last stored timestamp are dropped.
+
+        Returns the number of bars written.
+        """
+        ts = to_epoch_array(timestamps)
+        columns = {
+            "open": np.asarray(open_, dtype=COLUMNS["open"]),
+            "high": np.asarray(high, dtype=COLUMNS["high"]),
+            "low": np.asarray(low, dtype=COLUMNS["low"]),
+            "close": np.asarray(close, dtype=COLUMNS["close"]),
+            "volume": np.asarray(volume, dtype=COLUMNS["volume"]),
+        }
+        if any(col.shape != ts.shape for col in columns.values()):
+            raise ValueError(f"Column lengths do not match for {ticker}")
+        if ts.size > 1 and np.any(np.diff(ts) <= 0):
+            raise ValueError(f"Timestamps for {ticker} must be strictly increasing")
+
+        with self._lock:
+            self._check_generation()
+            existing = self._column(ticker, "timestamp")
+            n_existing = len(existing)
+            if n_existing:
+                keep = ts > existing[-1]
+                ts = ts[keep]
+                columns = {name: col[keep] for name, col in columns.items()}
+            if ts.size == 0:
+                return 0
+
+            os.makedirs(os.path.join(self.root_dir, ticker.upper()), exist_ok=True)
+            for name in PRICE_FIELDS:
+                path = self._column_path(ticker, name)
+                # Trim bytes left over from a previously interrupted append
+                if os.path.exists(path):
+                    expected = n_existing * COLUMNS[name].itemsize
+                    if os.path.getsize(path) != expected:
+                        with open(path, "r+b") as fh:
+                            fh.truncate(expected)
+                with open(path, "ab") as fh:
+                    fh.write(columns[name].tobytes())
+            with open(self._column_path(ticker, "timestamp"), "ab") as fh:
+                fh.write(ts.tobytes())
+            self._bump_generation()
+
+        logger.debug(f"📈 Appended {ts.size} bars for {ticker.upper()}")
+        return int(ts.size)
+
+    def _range_slice(self, ticker: str, start=None, end=None) -> slice:
+        ts = self._column(ticker, "timestamp")
+        lo = 0 if start is None else int(np.searchsorted(ts, to_epoch_seconds(start), side="left"))
+        hi = len(ts) if end is None else int(np.searchsorted(ts, to_epoch_seconds(end), side="right"))
+        return slice(lo, hi)
+
+    def read(self, ticker: str, start=None, end=None,
+             fields: Iterable[str] = ("timestamp",) + PRICE_FIELDS) -> Dict[str, np.ndarray]:
+        """Return the bars of ``ticker`` in ``[start, end]`` as read-only column views."""
+        self._check_generation()
+        return self._read(ticker, start, end, fields)
+
+    def _read(self, ticker: str, start, end, fields: Iterable[str]) -> Dict[str, np.ndarray]:
+        window = self._range_slice(ticker, start, end)
+        return {field: self._column(ticker, field)[window] for field in fields}
+
+    def read_matrix(self, tickers: List[str], field: str = "close",
+                    start=None, end=None, lookback: Optional[int] = None) -> np.ndarray:
+        """Stack one field of many tickers into a ``(len(tickers), n_bars)`` float matrix.
+
+        Columns are the union of the tickers' timestamps in ascending order, so
+        column ``-1`` is the latest bar seen by any ticker and a given column is
+        the same date in every row. Dates a ticker has no bar for carry its last
+        value forward, including its last bar before ``start``/``lookback``;
+        only dates before a ticker's first stored bar are NaN. ``lookback``
+        keeps only the last ``lookback`` dates of the range.
+        """
+        self._check_generation()
+        stamps, series, priors = [], [], []
+        for ticker in tickers:
+            window = self._range_slice(ticker, start, end)
+            if lookback is not None:
+                window = slice(max(window.start, window.stop - lookback), window.stop)
+            values = self._column(ticker, field)
+            stamps.append(self._column(ticker, "timestamp")[window])
+            series.append(values[window])
+            # Last bar before the window, carried into it when the ticker has a gap there
+            priors.append(values[window.start - 1] if window.start > 0 else np.nan)
+
+        calendar = max(stamps, key=len, default=np.empty(0, dtype=COLUMNS["timestamp"]))
+        if all(np.array_equal(ts, calendar[len(calendar) - len(ts):]) for ts in stamps):
+            # Common case: every ticker trades on a suffix of the same calendar
+            matrix = np.full((len(series), len(calendar)), np.nan, dtype=np.float64)
+            for row, (values, prior) in enumerate(zip(series, priors)):
+                gap = len(calendar) - len(values)
+                if gap:
+                    matrix[row, :gap] = prior
+                matrix[row, gap:] = values
+            return matrix
+
+        calendar = np.unique(np.concatenate(stamps))
+        if lookback is not None:
+            calendar = calendar[-lookback:]
+        matrix = np.full((len(series), len(calendar)), np.nan, dtype=np.float64)
+        for row, (ts, values, prior) in enumerate(zip(stamps, series, priors)):
+            first = int(np.searchsorted(ts, calendar[0]))
+            matrix[row, np.searchsorted(calendar, ts[first:])] = values[first:]
+            if np.isnan(matrix[row, 0]):
+                matrix[row, 0] = values[first - 1] if first > 0 else prior
+
+        # Forward-fill the dates a ticker did not trade on; leading NaNs stay
+        idx = np.where(np.isnan(matrix), 0, np.arange(matrix.shape[1]))
+        np.maximum.accumulate(idx, axis=1, out=idx)
+        filled = np.take_along_axis(matrix, idx, axis=1)
+        started = np.maximum.accumulate(~np.isnan(matrix), axis=1)
+        return np.where(started, filled, np.nan)
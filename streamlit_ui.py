@@ -1,11 +1,13 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 from exception.exceptions import TradingBotException
 import sys
 import os
 import logging
 import time
 import traceback
+import uuid
 from datetime import datetime
 
 # Configure logging
@@ -19,19 +21,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Log application startup
-logger.info("=" * 50)
-logger.info("STREAMLIT UI STARTING")
-logger.info("=" * 50)
-logger.info(f"Start time: {datetime.now()}")
-logger.info(f"Python version: {sys.version}")
-logger.info(f"Streamlit version: {st.__version__}")
-
 BASE_URL = "http://localhost:8000"
-logger.info(f"BASE_URL from environment: {BASE_URL}")
+HEALTH_CHECK_TTL = 30          # seconds a health check result is reused across reruns
+UPLOAD_CHUNK_SIZE = 256 * 1024  # bytes per streamed upload chunk
+
+
+# Streamlit re-executes this script on every interaction, so anything that
+# should happen once per process lives behind st.cache_resource / st.cache_data.
+@st.cache_resource(show_spinner=False)
+def log_startup():
+    logger.info("=" * 50)
+    logger.info("STREAMLIT UI STARTING")
+    logger.info("=" * 50)
+    logger.info(f"Start time: {datetime.now()}")
+    logger.info(f"Python version: {sys.version}")
+    logger.info(f"Streamlit version: {st.__version__}")
+    logger.info(f"BASE_URL from environment: {BASE_URL}")
+    return True
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_session() -> requests.Session:
+    """One keep-alive connection pool to the backend, shared by all reruns and sessions."""
+    logger.info("Creating pooled HTTP session")
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=HEALTH_CHECK_TTL, show_spinner=False)
+def check_backend_health():
+    """Return ``(status, detail)`` where status is ok / error / down / timeout / unknown."""
+    try:
+        logger.info(f"Making health check request to: {BASE_URL}/health")
+        start_time = time.time()
+        response = get_http_session().get(f"{BASE_URL}/health", timeout=3)
+        logger.info(f"Health check completed in {time.time() - start_time:.2f} seconds "
+                    f"(status {response.status_code})")
+        if response.status_code == 200:
+            return "ok", ""
+        logger.warning(f"Backend server responded with error status: {response.status_code}")
+        logger.warning(f"Response content: {response.text}")
+        return "error", response.text
+    except requests.exceptions.ConnectionError as e:
+        logger.error(f"Connection error during health check: {str(e)}")
+        return "down", str(e)
+    except requests.exceptions.Timeout as e:
+        logger.warning(f"Timeout during health check: {str(e)}")
+        return "timeout", str(e)
+    except Exception as e:
+        logger.error(f"Unexpected error during health check: {str(e)}")
+        logger.error(traceback.format_exc())
+        return "unknown", str(e)
+
+
+def stream_multipart(files, boundary, on_progress, chunk_size=UPLOAD_CHUNK_SIZE):
+    """Yield a multipart/form-data body for ``files`` in ``chunk_size`` pieces.
+
+    ``files`` holds ``(filename, data, content_type)`` tuples; ``on_progress``
+    is called with the number of file bytes sent so far.
+    """
+    sent = 0
+    for filename, data, content_type in files:
+        yield (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type or 'application/octet-stream'}\r\n\r\n"
+        ).encode()
+        view = memoryview(data)
+        for offset in range(0, len(view), chunk_size):
+            chunk = view[offset:offset + chunk_size]
+            yield bytes(chunk)
+            sent += len(chunk)
+            on_progress(sent)
+        yield b"\r\n"
+    yield f"--{boundary}--\r\n".encode()
 
-# Log page configuration
-logger.info("Setting up Streamlit page configuration...")
+
+# Page configuration must be the first Streamlit command of every rerun
 try:
     st.set_page_config(
         page_title="📈 Stock Market Agentic Chatbot",
@@ -39,66 +108,44 @@ try:
         layout="centered",
         initial_sidebar_state="expanded",
     )
-    logger.info("Page configuration set successfully")
 except Exception as e:
     logger.error(f"Failed to set page configuration: {str(e)}")
     logger.error(traceback.format_exc())
 
-logger.info("Setting up page title...")
+log_startup()
+session = get_http_session()
+
 st.title("📈 Stock Market Agentic Chatbot")
 
-# Check server status with detailed logging
-logger.info("Checking backend server status...")
-try:
-    logger.info(f"Making health check request to: {BASE_URL}/health")
-    start_time = time.time()
-    response = requests.get(f"{BASE_URL}/health", timeout=3)
-    end_time = time.time()
-    logger.info(f"Health check completed in {end_time - start_time:.2f} seconds")
-    logger.info(f"Response status: {response.status_code}")
-    logger.info(f"Response headers: {dict(response.headers)}")
-    
-    if response.status_code == 200:
-        logger.info("Backend server is healthy")
-        st.success("✅ Backend server is running")
-    else:
-        logger.warning(f"Backend server responded with error status: {response.status_code}")
-        logger.warning(f"Response content: {response.text}")
-        st.warning("⚠️ Backend server responded with an error")
-        
-except requests.exceptions.ConnectionError as e:
-    logger.error(f"Connection error during health check: {str(e)}")
-    logger.error(f"BASE_URL: {BASE_URL}")
+# Check server status. Only a healthy result is cached (for HEALTH_CHECK_TTL
+# seconds), so the banner clears on the next rerun once the backend comes up.
+health_status, health_detail = check_backend_health()
+if health_status != "ok":
+    check_backend_health.clear()
+if health_status == "ok":
+    st.success("✅ Backend server is running")
+elif health_status == "error":
+    st.warning("⚠️ Backend server responded with an error")
+elif health_status == "down":
     st.error("❌ Backend server is not running")
     st.info("💡 Start the server with: `python -m uvicorn main:app --host 0.0.0.0 --port 8000`")
-except requests.exceptions.Timeout as e:
-    logger.warning(f"Timeout during health check: {str(e)}")
+elif health_status == "timeout":
     st.warning("⚠️ Backend server is slow to respond")
     st.info("💡 The server is running but taking time to respond")
-except Exception as e:
-    logger.error(f"Unexpected error during health check: {str(e)}")
-    logger.error(traceback.format_exc())
-    st.warning(f"⚠️ Cannot check server status: {str(e)}")
+else:
+    st.warning(f"⚠️ Cannot check server status: {health_detail}")
 
 # Initialize session state
-logger.info("Initializing session state...")
 if "messages" not in st.session_state:
     logger.info("Creating new messages session state")
     st.session_state.messages = []
-else:
-    logger.info(f"Existing messages in session: {len(st.session_state.messages)}")
 
 # Sidebar setup
-logger.info("Setting up sidebar...")
 with st.sidebar:
     st.header("📄 Upload Documents")
     st.markdown("Upload **stock market PDFs or DOCX** to create knowledge base.")
-    
-    logger.info("Creating file uploader...")
+
     uploaded_files = st.file_uploader("Choose files", type=["pdf", "docx"], accept_multiple_files=True)
-    
-    if uploaded_files:
-        logger.info(f"Files uploaded: {[f.name for f in uploaded_files]}")
 
     if st.button("Upload and Ingest"):
         logger.info("Upload and Ingest button clicked")
@@ -106,39 +153,47 @@ with st.sidebar:
             logger.info(f"Processing {len(uploaded_files)} uploaded files")
             files = []
             for i, f in enumerate(uploaded_files):
-                logger.info(f"Processing file {i+1}: {f.name} (type: {f.type})")
                 try:
-                    file_data = f.read()
-                    logger.info(f"File {f.name} size: {len(file_data)} bytes")
+                    file_data = f.getvalue()
+                    logger.info(f"File {i+1}: {f.name} (type: {f.type}, size: {len(file_data)} bytes)")
                     if not file_data:
                         logger.warning(f"File {f.name} is empty, skipping")
                         continue
                     filename = f.name if hasattr(f, 'name') else f"file_{len(files)}.pdf"
-                    files.append(("files", (filename, file_data, f.type)))
-                    logger.info(f"Successfully added file {filename} to upload list")
+                    files.append((filename, file_data, f.type))
                 except Exception as e:
                     logger.error(f"Error processing file {f.name}: {str(e)}")
                     logger.error(traceback.format_exc())
 
             if files:
-                logger.info(f"Preparing to upload {len(files)} files")
+                total_bytes = sum(len(data) for _, data, _ in files)
+                logger.info(f"Preparing to upload {len(files)} files ({total_bytes} bytes)")
+                progress = st.progress(0.0, text="Uploading files...")
                 try:
+                    def on_progress(sent):
+                        progress.progress(min(sent / total_bytes, 1.0),
+                                          text=f"Uploading files... {sent // 1024} / {total_bytes // 1024} KB")
+
+                    boundary = uuid.uuid4().hex
+                    start_time = time.time()
                     with st.spinner("Uploading and processing files..."):
-                        logger.info(f"Making upload request to: {BASE_URL}/upload")
-                        start_time = time.time()
-                        response = requests.post(f"{BASE_URL}/upload", files=files, timeout=30)
-                        end_time = time.time()
-                        logger.info(f"Upload request completed in {end_time - start_time:.2f} seconds")
-                        logger.info(f"Upload response status: {response.status_code}")
-                        logger.info(f"Upload response headers: {dict(response.headers)}")
-                        
-                        if response.status_code == 200:
-                            logger.info("Files uploaded and processed successfully")
-                            st.success("✅ Files uploaded and processed successfully!")
-                        else:
-                            logger.error(f"Upload failed with status {response.status_code}: {response.text}")
-                            st.error(f"❌ Upload failed (Status: {response.status_code}): {response.text}")
-                            
+                        response = session.post(
+                            f"{BASE_URL}/upload",
+                            data=stream_multipart(files, boundary, on_progress),
+                            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+                            timeout=30,
+                        )
+                    logger.info(f"Upload request completed in {time.time() - start_time:.2f} seconds "
+                                f"(status {response.status_code})")
+                    progress.empty()
+
+                    if response.status_code == 200:
+                        logger.info("Files uploaded and processed successfully")
+                        st.success("✅ Files uploaded and processed successfully!")
+                    else:
+                        logger.error(f"Upload failed with status {response.status_code}: {response.text}")
+                        st.error(f"❌ Upload failed (Status: {response.status_code}): {response.text}")
+
                 except requests.exceptions.ConnectionError as e:
                     logger.error(f"Connection error during upload: {str(e)}")
                     st.error("❌ Cannot connect to server. Make sure the FastAPI server is running on port 8000.")
@@ -158,20 +213,16 @@ with st.sidebar:
             logger.warning("Upload button clicked but no files selected")
 
 # Chat interface setup
-logger.info("Setting up chat interface...")
 st.header("💬 Chat")
 
-# Display existing messages
-logger.info(f"Displaying {len(st.session_state.messages)} existing messages")
-for i, chat in enumerate(st.session_state.messages):
-    logger.info(f"Displaying message {i+1}: {chat['role']} - {chat['content'][:50]}...")
+# Display existing messages, one element each (no per-message logging on reruns)
+for chat in st.session_state.messages:
     if chat["role"] == "user":
         st.markdown(f"**🧑 You:** {chat['content']}")
     else:
         st.markdown(f"**🤖 Bot:** {chat['content']}")
 
 # Chat form
-logger.info("Creating chat form...")
 with st.form(key="chat_form", clear_on_submit=True):
     user_input = st.text_input("Your message", placeholder="e.g. Tell me about NIFTY 50")
     submit_button = st.form_submit_button("Send")
@@ -179,34 +230,24 @@ with st.form(key="chat_form", clear_on_submit=True):
 if submit_button and user_input.strip():
     logger.info(f"Chat form submitted with input: {user_input}")
     try:
-        logger.info("Adding user message to session state")
         st.session_state.messages.append({"role": "user", "content": user_input})
 
         with st.spinner("Bot is thinking..."):
-            logger.info("Preparing chat request payload")
             payload = {"question": user_input}
             logger.info(f"Making chat request to: {BASE_URL}/query")
-            logger.info(f"Request payload: {payload}")
-            
+
             start_time = time.time()
-            response = requests.post(f"{BASE_URL}/query", json=payload, timeout=30)
-            end_time = time.time()
-            logger.info(f"Chat request completed in {end_time - start_time:.2f} seconds")
-            logger.info(f"Chat response status: {response.status_code}")
-            logger.info(f"Chat response headers: {dict(response.headers)}")
+            response = session.post(f"{BASE_URL}/query", json=payload, timeout=30)
+            logger.info(f"Chat request completed in {time.time() - start_time:.2f} seconds "
+                        f"(status {response.status_code})")
 
         if response.status_code == 200:
-            logger.info("Chat request successful, processing response")
             response_data = response.json()
-            logger.info(f"Response data keys: {list(response_data.keys())}")
             answer = response_data.get("answer", "No answer returned.")
             logger.info(f"Bot answer length: {len(answer)} characters")
-            logger.info(f"Bot answer preview: {answer[:100]}...")
-            
-            logger.info("Adding bot response to session state")
+
             st.session_state.messages.append({"role": "bot", "content": answer})
-            logger.info("Triggering page rerun")
-            st.rerun()  
+            st.rerun()
         else:
             logger.error(f"Chat request failed with status {response.status_code}: {response.text}")
             st.error(f"❌ Bot failed to respond (Status: {response.status_code}): {response.text}")
@@ -223,6 +264,3 @@ if submit_button and user_input.strip():
         logger.error(traceback.format_exc())
         st.error(f"❌ Chat failed: {str(e)}")
         st.info("💡 Check if the FastAPI server is running and accessible.")
-
-logger.info("Streamlit UI setup completed")
-logger.info("=" * 50)
\ No newline at end of file
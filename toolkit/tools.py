@@ -1,18 +1,58 @@
 import os
+import numpy as np
 from langchain.tools import tool
 from langchain_community.tools import TavilySearchResults
 from langchain_community.tools.polygon.financials import PolygonFinancials
 from langchain_community.utilities.polygon import PolygonAPIWrapper
-from data_models.models import RagToolSchema
-from langchain_pinecone import PineconeVectorStore
+from data_models.models import RagToolSchema, TechnicalIndicatorSchema, BacktestSchema
+from market_data.store import OHLCVStore
+from market_data import indicators as indicators_module
+from backtesting.engine import run_backtest, summarize
+from backtesting.strategies import STRATEGIES
+from backtesting.sweep import parameter_grid, run_sweep
+from langchain_core.documents import Document
+from data_ingestion.chunk_store import ChunkStore
 from utils.model_loaders import ModelLoader
-from utils.config_loader import load_config
+from utils.config_loader import get_config, subscribe
+from utils.shared_cache import get_shared_cache
+from custom_logging.my_logger import logger
 from dotenv import load_dotenv
 from pinecone import Pinecone
 load_dotenv()
 api_wrapper = PolygonAPIWrapper()
 model_loader=ModelLoader()
-config = load_config()
+market_store = OHLCVStore(get_config().market_data.data_dir)
+chunk_store = ChunkStore(
+    get_config().chunk_store.data_dir,
+    get_config().chunk_store.max_segment_bytes,
+    get_config().chunk_store.compression_level,
+)
+_vector_index = None
+
+def _get_vector_index(pinecone_api_key):
+    """Pinecone index and embeddings, built once and rebuilt only after a relevant config change."""
+    global _vector_index
+    if _vector_index is None:
+        pc = Pinecone(api_key=pinecone_api_key)
+        _vector_index = (pc.Index(get_config().vector_db.index_name), model_loader.load_embeddings())
+    return _vector_index
+
+def _reset_vector_index(_section):
+    global _vector_index
+    _vector_index = None
+
+def _reload_market_store(market_data_config):
+    global market_store
+    if market_data_config.data_dir != market_store.root_dir:
+        market_store = OHLCVStore(market_data_config.data_dir)
+
+def _reload_chunk_store(chunk_store_config):
+    global chunk_store
+    chunk_store = ChunkStore(
+        chunk_store_config.data_dir,
+        chunk_store_config.max_segment_bytes,
+        chunk_store_config.compression_level,
+    )
 
 @tool(args_schema=RagToolSchema)
 def retriever_tool(question):
@@ -22,28 +62,165 @@ def retriever_tool(question):
         if not pinecone_api_key:
             return "⚠️ Pinecone API key not configured. RAG features disabled."
         
-        pc = Pinecone(api_key=pinecone_api_key)
-        vector_store = PineconeVectorStore(
-            index=pc.Index(config["vector_db"]["index_name"]), 
-            embedding=model_loader.load_embeddings()
+        retriever_config = get_config().retriever
+        index, embeddings = _get_vector_index(pinecone_api_key)
+        response = index.query(
+            vector=embeddings.embed_query(question),
+            top_k=retriever_config.top_k,
+            include_metadata=True,
+            include_values=False,
         )
-        retriever = vector_store.as_retriever(
-            search_type="similarity_score_threshold",
-            search_kwargs={
-                "k": config["retriever"]["top_k"], 
-                "score_threshold": config["retriever"]["score_threshold"]
-            },
-        )
-        retriever_result = retriever.invoke(question)
+        # Same relevance scale as PineconeVectorStore's similarity_score_threshold for cosine
+        matches = [m for m in response.matches if (m.score + 1) / 2 >= retriever_config.score_threshold]
+        texts = chunk_store.get_many([m.id for m in matches])
+
+        retriever_result = []
+        missing = []
+        for match in matches:
+            metadata = dict(match.metadata or {})
+            # Vectors ingested before the chunk store carry their text in metadata
+            text = texts.get(match.id) or metadata.pop("text", None)
+            if text is None:
+                missing.append(match.id)
+                continue
+            retriever_result.append(Document(id=match.id, page_content=text, metadata=metadata))
+        if missing:
+            logger.warning(f"⚠️ No chunk text in {chunk_store.root_dir} or vector metadata for "
+                           f"{len(missing)} matches: {missing}")
         return retriever_result
     except Exception as e:
         return f"❌ Error in RAG tool: {str(e)}"
 
-tavily_tool = TavilySearchResults(
-    max_results=config["tools"]["tavily"]["max_results"],
+def _latest(values: np.ndarray):
+    """Last value of every row, rounded, with NaN as None."""
+    last = np.round(values[:, -1], 4)
+    return [None if np.isnan(v) else float(v) for v in last]
+
+@tool(args_schema=TechnicalIndicatorSchema)
+def technical_indicators_tool(tickers, indicators=None, window=20, rsi_window=14, start=None, end=None):
+    """Compute technical indicators (sma, ema, rsi, macd, bollinger, volatility) from local price history and return the latest value per ticker"""
+    try:
+        requested = indicators or list(indicators_module.INDICATORS)
+        unknown = [name for name in requested if name not in indicators_module.INDICATORS]
+        if unknown:
+            return f"❌ Unknown indicators: {unknown}. Choose from {list(indicators_module.INDICATORS)}"
+
+        tickers = [t.upper() for t in tickers]
+        found = market_store.existing_tickers(tickers)
+        missing = [t for t in tickers if t not in found]
+        if not found:
+            return f"⚠️ No local price history for: {missing}"
+
+        lookback = None if start else get_config().market_data.lookback
+        close = market_store.read_matrix(found, "close", start=start, end=end, lookback=lookback)
+        if close.shape[1] == 0:
+            return "⚠️ No price bars in the requested date range"
+
+        columns = {"close": _latest(close)}
+        for name in requested:
+            if name == "rsi":
+                columns["rsi"] = _latest(indicators_module.rsi(close, rsi_window))
+            elif name == "macd":
+                for key, values in indicators_module.macd(close).items():
+                    columns[f"macd_{key}" if key != "macd" else "macd"] = _latest(values)
+            elif name == "bollinger":
+                for key, values in indicators_module.bollinger_bands(close, window).items():
+                    columns[f"bollinger_{key}"] = _latest(values)
+            else:
+                columns[f"{name}_{window}"] = _latest(indicators_module.INDICATORS[name](close, window))
+
+        result = {
+            ticker: {key: values[row] for key, values in columns.items()}
+            for row, ticker in enumerate(found)
+        }
+        if missing:
+            result["missing_tickers"] = missing
+        return result
+    except Exception as e:
+        return f"❌ Error in technical indicators tool: {str(e)}"
+
+@tool(args_schema=BacktestSchema)
+def backtest_tool(tickers, strategy="ma_crossover", parameters=None, param_grid=None, start=None, end=None):
+    """Backtest a trading strategy (ma_crossover, momentum, mean_reversion) on local price history and report return, Sharpe ratio and max drawdown"""
+    try:
+        if strategy not in STRATEGIES:
+            return f"❌ Unknown strategy '{strategy}'. Choose from {list(STRATEGIES)}"
+
+        tickers = [t.upper() for t in tickers]
+        found = market_store.existing_tickers(tickers)
+        missing = [t for t in tickers if t not in found]
+        if not found:
+            return f"⚠️ No local price history for: {missing}"
+
+        close = market_store.read_matrix(found, "close", start=start, end=end)
+        if close.shape[1] < 2:
+            return "⚠️ Not enough price bars in the requested date range"
+
+        backtest_config = get_config().backtest
+        cost_bps = backtest_config.cost_bps
+        if param_grid:
+            grid = [{**(parameters or {}), **params} for params in parameter_grid(**param_grid)]
+            ranked = run_sweep(close, strategy, grid, cost_bps, backtest_config.max_workers)
+            return {"strategy": strategy, "bars": close.shape[1], "top_results": ranked[:5]}
+
+        result = run_backtest(close, STRATEGIES[strategy](close, **(parameters or {})), cost_bps)
+        metrics = ("total_return", "annual_return", "sharpe", "max_drawdown", "trades")
+        per_ticker = {
+            ticker: {name: round(float(result[name][row]), 4) for name in metrics}
+            for row, ticker in enumerate(found)
+        }
+        response = {
+            "strategy": strategy,
+            "bars": close.shape[1],
+            "portfolio": {k: round(v, 4) for k, v in summarize(result).items()},
+            "tickers": per_ticker,
+        }
+        if missing:
+            response["missing_tickers"] = missing
+        return response
+    except Exception as e:
+        return f"❌ Error in backtest tool: {str(e)}"
+
+def _tavily_succeeded(result):
+    # On failure Tavily returns (repr(error), {}) instead of raising
+    content, artifact = result
+    return bool(artifact) and not isinstance(content, str)
+
+class CachedTavilySearchResults(TavilySearchResults):
+    """Tavily search whose results are shared across workers for ``shared_cache.tool_result_ttl`` seconds."""
+
+    def _run(self, query, run_manager=None):
+        return get_shared_cache().get_or_set(
+            "tool:tavily", [query, self.max_results, self.search_depth],
+            lambda: super(CachedTavilySearchResults, self)._run(query, run_manager=run_manager),
+            get_config().shared_cache.tool_result_ttl,
+            cacheable=_tavily_succeeded,
+        )
+
+class CachedPolygonFinancials(PolygonFinancials):
+    """Polygon financials whose results are shared across workers for ``shared_cache.tool_result_ttl`` seconds."""
+
+    def _run(self, query, run_manager=None):
+        return get_shared_cache().get_or_set(
+            "tool:polygon_financials", query.strip().upper(),
+            lambda: super(CachedPolygonFinancials, self)._run(query, run_manager=run_manager),
+            get_config().shared_cache.tool_result_ttl,
+        )
+
+tavily_tool = CachedTavilySearchResults(
+    max_results=get_config().tools.tavily.max_results,
     search_depth="advanced",
     include_raw_content=True,
     include_answer=True
     )
 
-financials_tool = PolygonFinancials(api_wrapper=api_wrapper)
\ No newline at end of file
+financials_tool = CachedPolygonFinancials(api_wrapper=api_wrapper)
+
+def _update_tavily(tools_config):
+    tavily_tool.max_results = tools_config.tavily.max_results
+
+subscribe("vector_db", _reset_vector_index)
+subscribe("embedding_model", _reset_vector_index)
+subscribe("chunk_store", _reload_chunk_store)
+subscribe("market_data", _reload_market_store)
+subscribe("tools", _update_tavily)
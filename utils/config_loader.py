@@ -1,8 +1,224 @@
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+
 import yaml
+from pydantic import BaseModel, Field, ValidationError
+
+from custom_logging.my_logger import logger
+
+DEFAULT_CONFIG_PATH = "config/config.yaml"
+# e.g. TRADING_BOT__RETRIEVER__TOP_K=5 overrides retriever.top_k
+ENV_PREFIX = "TRADING_BOT__"
+
+
+class VectorDBConfig(BaseModel):
+    index_name: str
+
+class RetrieverConfig(BaseModel):
+    top_k: int = Field(default=3, ge=1)
+    score_threshold: float = Field(default=0.5, ge=0, le=1)
+
+class EmbeddingModelConfig(BaseModel):
+    provider: str
+    model_name: str
+
+class LLMProviderConfig(BaseModel):
+    provider: str
+    model_name: str
+
+class TavilyConfig(BaseModel):
+    max_results: int = Field(default=5, ge=1)
+
+class ToolsConfig(BaseModel):
+    tavily: TavilyConfig = TavilyConfig()
+
+class MarketDataConfig(BaseModel):
+    data_dir: str = "market_data_store"
+    lookback: int = Field(default=500, ge=1)
+
+class BacktestConfig(BaseModel):
+    cost_bps: float = Field(default=5, ge=0)
+    max_workers: int = Field(default=4, ge=1)
+
+class ChunkStoreConfig(BaseModel):
+    data_dir: str = "chunk_store"
+    max_segment_bytes: int = Field(default=64 * 1024 * 1024, ge=1024)
+    compression_level: int = Field(default=3, ge=1, le=22)
+
+class RouterConfig(BaseModel):
+    enabled: bool = True
+    confidence_threshold: float = Field(default=0.75, ge=0, le=1)
+    max_iterations: int = Field(default=4, ge=1)
+
+class SharedCacheConfig(BaseModel):
+    path: str = "cache/shared_cache.sqlite3"
+    # null keeps embeddings forever; expired rows are purged hourly
+    embedding_ttl: Optional[float] = Field(default=30 * 24 * 3600, gt=0)
+    tool_result_ttl: float = Field(default=900, gt=0)
+
+class AppConfig(BaseModel):
+    vector_db: VectorDBConfig
+    retriever: RetrieverConfig = RetrieverConfig()
+    embedding_model: EmbeddingModelConfig
+    llm: Dict[str, LLMProviderConfig]
+    tools: ToolsConfig = ToolsConfig()
+    market_data: MarketDataConfig = MarketDataConfig()
+    backtest: BacktestConfig = BacktestConfig()
+    router: RouterConfig = RouterConfig()
+    chunk_store: ChunkStoreConfig = ChunkStoreConfig()
+    shared_cache: SharedCacheConfig = SharedCacheConfig()
+
+
+def _apply_env_overrides(raw: dict, environ=os.environ) -> dict:
+    """Overlay ``TRADING_BOT__SECTION__KEY=value`` variables onto the parsed YAML."""
+    for name, value in environ.items():
+        if not name.startswith(ENV_PREFIX):
+            continue
+        keys = [key.lower() for key in name[len(ENV_PREFIX):].split("__") if key]
+        if not keys:
+            continue
+        node = raw
+        for key in keys[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        # YAML scalar parsing turns "5" into 5, "true" into True, etc.
+        node[keys[-1]] = yaml.safe_load(value)
+    return raw
+
+
+class ConfigManager:
+    """Parses a config file once and re-parses it only when it changes on disk.
+
+    A change is a new ``(st_mtime_ns, st_size)`` pair, so an edit that lands
+    within the filesystem's timestamp granularity but changes the length is
+    still picked up.
+
+    Readers always see a complete, validated ``AppConfig``: a new object is
+    built off to the side and swapped in with a single assignment. An edit
+    that fails to parse or validate is logged and the previous config kept.
+    Subscribers registered per top-level section are called with the new
+    section whenever a reload changes it.
+    """
+
+    def __init__(self, config_path: str = DEFAULT_CONFIG_PATH, check_interval: float = 1.0):
+        self.config_path = config_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._config: Optional[AppConfig] = None
+        self._file_key: Optional[Tuple[int, int]] = None
+        self._failed_key: Optional[Tuple[int, int]] = None
+        self._last_check = 0.0
+        self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self._watcher: Optional[threading.Thread] = None
+
+    def _parse(self) -> AppConfig:
+        with open(self.config_path, "r") as file:
+            raw = yaml.safe_load(file) or {}
+        if not isinstance(raw, dict):
+            raise ValueError(f"Top level of {self.config_path} must be a mapping, got {type(raw).__name__}")
+        return AppConfig.model_validate(_apply_env_overrides(raw))
+
+    def get(self) -> AppConfig:
+        now = time.monotonic()
+        if self._config is None or now - self._last_check >= self.check_interval:
+            self.reload_if_changed(now)
+        return self._config
+
+    def reload_if_changed(self, now: Optional[float] = None) -> bool:
+        """Re-parse the file if it changed. Returns True when a new config was installed.
+
+        A file that fails to parse is retried on every check until it parses,
+        so a fix saved with an unchanged mtime and size is not missed.
+        """
+        with self._lock:
+            self._last_check = time.monotonic() if now is None else now
+            try:
+                stat = os.stat(self.config_path)
+            except OSError:
+                if self._config is None:
+                    raise
+                logger.error(f"❌ Config file {self.config_path} disappeared, keeping previous config")
+                return False
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            if self._config is not None and file_key == self._file_key:
+                return False
+
+            try:
+                new_config = self._parse()
+            except (yaml.YAMLError, ValidationError, ValueError) as e:
+                if self._config is None:
+                    raise
+                if file_key != self._failed_key:
+                    logger.error(f"❌ Invalid config in {self.config_path}, keeping previous config: {str(e)}")
+                    self._failed_key = file_key
+                return False
+
+            old_config, self._config, self._file_key = self._config, new_config, file_key
+            self._failed_key = None
+
+        if old_config is None:
+            logger.info(f"⚙️ Config loaded from {self.config_path}")
+        else:
+            logger.info(f"🔄 Config reloaded from {self.config_path}")
+            self._notify(old_config, new_config)
+        return True
+
+    def subscribe(self, section: str, callback: Callable):
+        """Call ``callback(new_section)`` whenever ``section`` changes on reload."""
+        if section not in AppConfig.model_fields:
+            raise ValueError(f"Unknown config section: {section}")
+        self._subscribers[section].append(callback)
+
+    def _notify(self, old_config: AppConfig, new_config: AppConfig):
+        for section, callbacks in list(self._subscribers.items()):
+            new_section = getattr(new_config, section)
+            if getattr(old_config, section) == new_section:
+                continue
+            logger.info(f"🔄 Config section '{section}' changed, notifying {len(callbacks)} subscribers")
+            for callback in callbacks:
+                try:
+                    callback(new_section)
+                except Exception as e:
+                    logger.error(f"❌ Config subscriber for '{section}' failed: {str(e)}")
+
+    def start_watcher(self, interval: Optional[float] = None):
+        """Poll the file in a daemon thread so subscribers hear about edits without a reader."""
+        if self._watcher is not None:
+            return
+        interval = interval or self.check_interval
+
+        def watch():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.reload_if_changed()
+                except Exception as e:
+                    logger.error(f"❌ Config watcher error: {str(e)}")
+
+        self._watcher = threading.Thread(target=watch, name="config-watcher", daemon=True)
+        self._watcher.start()
+
+
+_managers: Dict[str, ConfigManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_config_manager(config_path: str = DEFAULT_CONFIG_PATH) -> ConfigManager:
+    manager = _managers.get(config_path)
+    if manager is None:
+        with _managers_lock:
+            manager = _managers.setdefault(config_path, ConfigManager(config_path))
+    return manager
+
+
+def get_config(config_path: str = DEFAULT_CONFIG_PATH) -> AppConfig:
+    return get_config_manager(config_path).get()
+
 
-def load_config(config_path: str =  "config/config.yaml") -> dict:
-    with open(config_path, "r") as file:
-        config = yaml.safe_load(file)
-    return config
+def subscribe(section: str, callback: Callable, config_path: str = DEFAULT_CONFIG_PATH):
+    get_config_manager(config_path).subscribe(section, callback)
 
- 
\ No newline at end of file
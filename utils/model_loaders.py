@@ -1,17 +1,55 @@
 import os
+import sqlite3
 from dotenv import load_dotenv
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_google_genai import ChatGoogleGenerativeAI
-from utils.config_loader import load_config
+from utils.config_loader import get_config
+from utils.shared_cache import get_shared_cache
+from custom_logging.my_logger import logger
+from langchain_core.embeddings import Embeddings
 from langchain_groq import ChatGroq
 
+class CachedEmbeddings(Embeddings):
+    """Embeddings backed by the cross-worker shared cache, keyed by model name and text."""
+
+    def __init__(self, embeddings: Embeddings, model_name: str):
+        self.embeddings = embeddings
+        self.namespace = f"embeddings:{model_name}"
+
+    def embed_documents(self, texts):
+        cache = get_shared_cache()
+        ttl = get_config().shared_cache.embedding_ttl
+        keys = [cache.make_key(text) for text in texts]
+        try:
+            vectors = [cache.get(self.namespace, key) for key in keys]
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Shared cache read failed for {self.namespace}: {str(e)}")
+            vectors = [None] * len(texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            computed = self.embeddings.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, computed):
+                vectors[i] = vector
+            try:
+                for i in missing:
+                    cache.set(self.namespace, keys[i], vectors[i], ttl)
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Shared cache write failed for {self.namespace}: {str(e)}")
+        return vectors
+
+    def embed_query(self, text):
+        return get_shared_cache().get_or_set(
+            f"{self.namespace}:query", text,
+            lambda: self.embeddings.embed_query(text),
+            get_config().shared_cache.embedding_ttl,
+        )
+
 class ModelLoader:
 
     def __init__(self):
         load_dotenv()
         self._validate_env()
-        self.config=load_config()
 
     def _validate_env(self):
         required_vars = ["GOOGLE_API_KEY", "GROQ_API_KEY"]
@@ -27,8 +65,8 @@ class ModelLoader:
         self.groq_api_key = os.getenv("GROQ_API_KEY")
 
     def load_embeddings(self):
-        model_name=self.config["embedding_model"]["model_name"]
-        return GoogleGenerativeAIEmbeddings(model=model_name)
+        model_name=get_config().embedding_model.model_name
+        return CachedEmbeddings(GoogleGenerativeAIEmbeddings(model=model_name), model_name)
 
     def load_llm(self):
         print("LLM loading...")
@@ -36,7 +74,7 @@ class ModelLoader:
             if not self.groq_api_key:
                 raise ValueError("GROQ_API_KEY not configured")
             
-            model_name=self.config["llm"]["groq"]["model_name"]
+            model_name=get_config().llm["groq"].model_name
             groq_model=ChatGroq(model=model_name, api_key=self.groq_api_key)
             
             return groq_model
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from custom_logging.my_logger import logger
+from utils.config_loader import get_config
+
+_MISSING = object()
+
+
+class SQLiteCache:
+    """Key/value cache in a SQLite database in WAL mode, shared by every worker process.
+
+    Readers never block the writer under WAL, so all gunicorn workers can hit
+    one file instead of each warming a private in-memory cache. Values are
+    pickled; entries may carry a TTL in seconds. Expired rows are deleted by
+    a ``set`` at most once per ``purge_interval`` seconds in each process.
+    Connections are opened per thread and per process, so an instance
+    created before a fork stays usable in the children.
+    """
+
+    def __init__(self, path: str, purge_interval: float = 3600.0):
+        self.path = path
+        self.purge_interval = purge_interval
+        self._next_purge = time.time() + purge_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL,"
+                " expires_at REAL, PRIMARY KEY (namespace, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def make_key(parts: Any) -> str:
+        return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        row = self._connection().execute(
+            "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return default
+        return pickle.loads(row[0])
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None):
+        expires_at = time.time() + ttl if ttl else None
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), expires_at),
+        )
+        if time.time() >= self._next_purge:
+            self._next_purge = time.time() + self.purge_interval
+            purged = self.purge_expired()
+            if purged:
+                logger.info(f"🧹 Purged {purged} expired entries from the shared cache")
+
+    def get_or_set(self, namespace: str, parts: Any, compute: Callable[[], Any],
+                   ttl: Optional[float] = None,
+                   cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """Cached value for ``parts`` (any JSON-able key), computing and storing it on a miss.
+
+        A computed value for which ``cacheable(value)`` is false (e.g. an
+        error result) is returned without being stored.
+        """
+        key = self.make_key(parts)
+        try:
+            value = self.get(namespace, key, _MISSING)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Shared cache read failed for {namespace}: {str(e)}")
+            value = _MISSING
+        if value is not _MISSING:
+            return value
+
+        value = compute()
+        if cacheable is not None and not cacheable(value):
+            return value
+        try:
+            self.set(namespace, key, value, ttl)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Shared cache write failed for {namespace}: {str(e)}")
+        return value
+
+    def purge_expired(self) -> int:
+        cursor = self._connection().execute(
+            "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+        )
+        return cursor.rowcount
+
+
+_shared_cache: Optional[SQLiteCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> SQLiteCache:
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = SQLiteCache(get_config().shared_cache.path)
+    return _shared_cache